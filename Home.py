@@ -1,6 +1,6 @@
 import streamlit as st
-from PIL import Image
 import os
+from utils.warmup import start_warmup
 
 def show_home():
     # Title and Subtitle
@@ -18,8 +18,8 @@ def show_home():
 
     # Optional Banner Image (from assets folder if available)
     try:
-        image = Image.open("assets/student_success_banner.png")
-        st.image(image, use_container_width=True)
+        # Streamlit serves the PNG bytes as they are, no decode/re-encode with PIL
+        st.image("assets/student_success_banner.png", use_column_width=True)
     except Exception:
         st.info("STUDENT SUCCESS VS DROPOUT IMAGE PLACEHOLDER")
 
@@ -48,5 +48,8 @@ def show_home():
     - **Summary Report** — Review conclusions and findings  
     """)
 
+# Start filling the shared caches in the background on the first visit
+start_warmup()
+
 # Run the homepage
 show_home()
@@ -0,0 +1,73 @@
+"""Cross-check of utils/association.py against scipy and scikit-learn.
+
+Every measure is recomputed feature by feature with the reference library
+functions on the same rows (the feature and Target present) and bins, and the largest relative
+difference per measure is printed. Exits non-zero above the tolerance.
+scipy and scikit-learn are only needed for this check, not by the app::
+
+    pip install scipy scikit-learn
+    python -m benchmarks.check_associations
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from sklearn.metrics import mutual_info_score
+
+from config import STUDENT_DATA_PATH
+from utils.association import MAX_BINS, feature_target_associations
+from utils.data_loader import file_format, read_student_file
+from utils.schema import numeric_columns
+
+
+def reference_associations(df, features, target='Target', max_bins=MAX_BINS):
+    """The same measures from scipy/scikit-learn, one feature at a time."""
+    rows = {}
+    for col in features:
+        complete = df[[col, target]].dropna()
+        if complete.empty:
+            rows[col] = dict.fromkeys(['spearman', 'anova_f', 'mutual_info', 'cramers_v'], np.nan)
+            continue
+        x = complete[col].to_numpy(dtype='float64')
+        y = complete[target].cat.codes.to_numpy()
+        ranks = stats.rankdata(x)
+        # One bin per distinct value, else equal-frequency bins by rank
+        values, bins = np.unique(x, return_inverse=True)
+        if len(values) > max_bins:
+            bins = np.minimum(((ranks - 1) * max_bins / len(x)).astype(np.int64), max_bins - 1)
+        table = pd.crosstab(bins, y).to_numpy()
+        rows[col] = {
+            'spearman': stats.spearmanr(x, y).statistic,
+            'anova_f': stats.f_oneway(*(x[y == c] for c in np.unique(y))).statistic,
+            'mutual_info': mutual_info_score(bins, y),
+            'cramers_v': stats.contingency.association(table, method='cramer', correction=False),
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data', default=STUDENT_DATA_PATH)
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    df = read_student_file(args.data, file_format(args.data))
+    features = numeric_columns(df)
+    ours = feature_target_associations(df, features)
+    reference = reference_associations(df, features)[ours.columns]
+
+    scale = np.maximum(reference.abs().to_numpy(), 1e-12)
+    diff = pd.DataFrame(np.abs(ours.to_numpy() - reference.to_numpy()) / scale,
+                        index=ours.index, columns=ours.columns)
+    # Both sides must agree on which measures are undefined (e.g. an empty column)
+    diff = diff.mask(ours.isna() & reference.isna(), 0.0).fillna(np.inf)
+    worst = diff.max()
+    print(f"{len(features)} features, {len(df)} rows; max relative difference per measure:")
+    print(worst.to_string(float_format=lambda v: f"{v:.2e}"))
+    return 0 if (worst <= args.tolerance).all() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Headless rerun-latency and memory benchmarks for every page.
+
+Each page runs in a fresh Python process (so caches start cold) through
+Streamlit's ``AppTest`` against synthetic datasets at several multiples of
+the real row count. For the cold load and a few typical widget interactions
+it records wall time, time spent inside pandas/NumPy versus plotting
+(sampled from the script thread's stack) and the peak RSS sampled during that
+step. Every process also gets an empty snapshot folder, so each cold load
+parses the CSV regardless of earlier runs. Results are written as JSON so runs
+can be compared over time::
+
+    python -m benchmarks.run_benchmarks --scales 1 10 100
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = [
+    "Home.py",
+    "pages/1_Data_Overview.py",
+    "pages/2_Feature_Analysis.py",
+    "pages/3_Correlation_Study.py",
+    "pages/4_EDA_Insights.py",
+    "pages/5_Summary_Report.py",
+]
+
+# Widget interactions per page: (step name, widget kind, widget label, new value)
+INTERACTIONS = {
+    "pages/1_Data_Overview.py": [
+        ("next_preview_page", "number_input", None, 2),
+    ],
+    "pages/2_Feature_Analysis.py": [
+        ("toggle_show_abs", "checkbox", "Show absolute correlation?", False),
+        ("move_top_n", "slider", "Select number of top features to plot", 3),
+    ],
+    "pages/3_Correlation_Study.py": [
+        ("toggle_show_abs", "checkbox", "Show absolute correlation?", False),
+        ("move_top_n", "slider", "Number of top features to display", 5),
+    ],
+    "pages/4_EDA_Insights.py": [
+        ("filter_target", "multiselect", "Select Target", ["Dropout", "Graduate"]),
+        ("filter_gender", "multiselect", "Select Gender", [1]),
+    ],
+}
+
+# Outermost library on the stack decides where a sample's time goes
+_PANDAS_PACKAGES = ("pandas", "numpy", "pyarrow")
+_PLOTTING_PACKAGES = ("matplotlib", "seaborn", "PIL", "plotly")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes():
+    # Current resident set size; None where /proc is not available (e.g. macOS)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StackSampler:
+    """Samples the page script's thread and attributes time to pandas or plotting.
+
+    Each tick also reads the process RSS, so ``peak_rss_mb`` is the high-water
+    mark of this step alone rather than of the whole process.
+    """
+
+    def __init__(self, script_path, interval=0.005):
+        self.script_path = os.path.abspath(script_path)
+        self.interval = interval
+        self.samples = {"pandas": 0, "plotting": 0, "other": 0}
+        self.peak_rss = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._sample_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample_rss()
+
+    def _sample_rss(self):
+        rss = _rss_bytes()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def _classify(self, frame):
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code.co_filename)
+            frame = frame.f_back
+        if not any(os.path.abspath(name) == self.script_path for name in stack):
+            return None  # not a page script thread
+        for name in reversed(stack):
+            parts = name.replace("\\", "/").split("/")
+            if "site-packages" in parts:
+                package = parts[parts.index("site-packages") + 1]
+                if package in _PANDAS_PACKAGES:
+                    return "pandas"
+                if package in _PLOTTING_PACKAGES:
+                    return "plotting"
+        return "other"
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample_rss()
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    category = self._classify(frame)
+                    if category:
+                        self.samples[category] += 1
+
+    def seconds(self):
+        return {f"{category}_s": round(count * self.interval, 3) for category, count in self.samples.items()}
+
+    def peak_rss_mb(self):
+        return None if self.peak_rss is None else round(self.peak_rss / (1024 * 1024), 1)
+
+
+def _find_widget(at, kind, label):
+    widgets = getattr(at, kind)
+    for widget in widgets:
+        if label is None or widget.label == label:
+            return widget
+    raise LookupError(f"No {kind} labelled {label!r}")
+
+
+def _measure(step, at, page):
+    sampler = StackSampler(os.path.join(ROOT, page))
+    start = time.perf_counter()
+    with sampler:
+        at.run()
+    result = {
+        "step": step,
+        "wall_s": round(time.perf_counter() - start, 3),
+        **sampler.seconds(),
+        "peak_rss_mb": sampler.peak_rss_mb(),
+        "exceptions": [e.message for e in at.exception],
+    }
+    return result
+
+
+def run_page(page, timeout):
+    """Cold load plus the page's interactions, in the current process."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(page, default_timeout=timeout)
+    steps = [_measure("cold_load", at, page)]
+    for step, kind, label, value in INTERACTIONS.get(page, []):
+        widget = _find_widget(at, kind, label)
+        if kind == "checkbox":
+            widget.check() if value else widget.uncheck()
+        else:
+            widget.set_value(value)
+        steps.append(_measure(step, at, page))
+    return steps
+
+
+def _run_isolated(page, data_path, timeout):
+    # No background warm-up, so each page is timed on its own work, and no snapshot
+    # left by an earlier page or run, so every cold load includes the CSV parse
+    cache_dir = tempfile.mkdtemp(prefix="student_app_bench_")
+    env = dict(os.environ, STUDENT_DATA_PATH=data_path, STUDENT_APP_WARMUP="0", STUDENT_DATA_CACHE_DIR=cache_dir)
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run_benchmarks", "--child", page, "--timeout", str(timeout)],
+            cwd=ROOT, env=env, capture_output=True, text=True,
+        )
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    if completed.returncode != 0:
+        return [{"step": "cold_load", "error": completed.stderr.strip().splitlines()[-1:]}]
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-page rerun latency and peak memory benchmarks.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000],
+                        help="multiples of the real row count to test (default: 1 10 100 1000)")
+    parser.add_argument("--pages", nargs="+", default=PAGES, help="page scripts to run")
+    parser.add_argument("--data-dir", default=os.path.join(ROOT, "benchmarks", ".data"),
+                        help="where the synthetic datasets are generated and kept")
+    parser.add_argument("--output", help="JSON file to write (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--timeout", type=float, default=900, help="seconds allowed per script run")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_page(args.child, args.timeout)))
+        return
+
+    from benchmarks.synthetic_data import dataset_for_scale
+
+    created = datetime.now(timezone.utc)
+    report = {
+        "created": created.isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": [],
+    }
+    for scale in args.scales:
+        data_path = dataset_for_scale(scale, args.data_dir)
+        with open(data_path, "rb") as f:
+            rows = sum(1 for _ in f) - 1
+        for page in args.pages:
+            for step in _run_isolated(page, data_path, args.timeout):
+                report["results"].append({"scale": scale, "rows": rows, "page": page, **step})
+                print(f"x{scale:<5} {page:<32} {step['step']:<18} "
+                      f"{step.get('wall_s', float('nan')):>8}s  peak {step.get('peak_rss_mb', '?')} MB")
+
+    output = args.output or os.path.join(ROOT, "benchmarks", "results",
+                                         f"{created.strftime('%Y%m%dT%H%M%SZ')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
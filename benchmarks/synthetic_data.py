@@ -0,0 +1,59 @@
+"""Synthetic student datasets at a multiple of the real row count.
+
+Rows are bootstrapped from ``data/student_data.csv`` so every column keeps
+its distribution and the joint structure between columns; continuous columns
+get a little noise so the scaled file is not just exact duplicates. The
+output uses the same header and separator as the source file.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from config import STUDENT_DATA_PATH
+
+# Rows generated and written per step, bounds memory at large scales
+CHUNK_ROWS = 500_000
+
+
+def generate(scale, out_path, source=STUDENT_DATA_PATH, seed=0):
+    """Write a dataset with ``scale`` times the source's rows to ``out_path``."""
+    base = pd.read_csv(source, sep=';', skipinitialspace=True)
+    if scale == 1:
+        base.to_csv(out_path, sep=';', index=False)
+        return len(base)
+
+    rng = np.random.default_rng(seed)
+    continuous = [col for col in base.columns if base[col].dtype.kind == 'f']
+    spread = base[continuous].std() * 0.01
+    low, high = base[continuous].min(), base[continuous].max()
+
+    total = len(base) * scale
+    tmp = f"{out_path}.tmp"
+    with open(tmp, 'w', newline='') as f:
+        for start in range(0, total, CHUNK_ROWS):
+            size = min(CHUNK_ROWS, total - start)
+            chunk = base.iloc[rng.integers(0, len(base), size)].reset_index(drop=True)
+            noise = rng.normal(0, 1, (size, len(continuous))) * spread.to_numpy()
+            chunk[continuous] = (chunk[continuous] + noise).clip(low, high, axis=1).round(4)
+            chunk.to_csv(f, sep=';', index=False, header=start == 0)
+    os.replace(tmp, out_path)
+    return total
+
+
+def dataset_for_scale(scale, data_dir, source=STUDENT_DATA_PATH):
+    """Path of the synthetic dataset for ``scale``, generating it if missing."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"student_data_x{scale}.csv")
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+        generate(scale, path, source)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scale', type=int)
+    parser.add_argument('output')
+    args = parser.parse_args()
+    print(f"Wrote {generate(args.scale, args.output)} rows to {args.output}")
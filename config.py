@@ -1,2 +1,26 @@
+import os
+
 # STUDENT_DATA_PATH = r"YOUR_CSV_FILE_PATH"
-STUDENT_DATA_PATH="data/student_data.csv"
\ No newline at end of file
+# The STUDENT_DATA_PATH environment variable overrides it (used by the benchmarks)
+STUDENT_DATA_PATH=os.environ.get("STUDENT_DATA_PATH", "data/student_data.csv")
+
+# Folder for the columnar (Parquet) snapshots written by utils/data_loader.py;
+# the STUDENT_DATA_CACHE_DIR environment variable overrides it (the benchmarks use a fresh one per run)
+DATA_CACHE_DIR=os.environ.get("STUDENT_DATA_CACHE_DIR", "data/.cache")
+
+# Memory budget (bytes) for rendered chart images shared by all sessions
+FIGURE_CACHE_BYTES=64 * 1024 * 1024
+
+# Streaming profiler: byte range per worker process, and number of workers (None = all cores)
+PROFILE_CHUNK_BYTES=64 * 1024 * 1024
+PROFILE_WORKERS=None
+
+# Span tracing of the page hot paths (utils/tracing.py); STUDENT_APP_TRACE=1 also turns it on.
+# Set a path to None to skip that output.
+TRACE_ENABLED=False
+TRACE_LOG_PATH="logs/trace.jsonl"
+TRACE_PROM_PATH="logs/student_app.prom"
+
+# Background warm-up of the shared caches and default charts (utils/warmup.py);
+# STUDENT_APP_WARMUP=0 turns it off (the benchmarks do, to time each page on its own)
+WARMUP_ENABLED=os.environ.get("STUDENT_APP_WARMUP", "1") != "0"
@@ -1,69 +1,77 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 from config import STUDENT_DATA_PATH
+from utils.association import MEASURES, feature_associations
+from utils.chart_specs import (FEATURE_ANALYSIS_MEASURE, FEATURE_ANALYSIS_TOP_N, target_associations,
+                               top_associations_chart)
+from utils.correlation import correlation_stats
+from utils.data_loader import active_dataset, load_data
+from utils.figure_cache import show_chart
+from utils.schema import numeric_columns
+from utils.tracing import end_page_trace, span, start_page_trace
+from utils.warmup import start_warmup
 
 st.title("Feature Analysis")
+start_page_trace("Feature Analysis")
+start_warmup()
 
 try:
-    # Load and clean dataset
-    df = pd.read_csv(STUDENT_DATA_PATH, sep=';', skipinitialspace=True)
-    df.columns = df.columns.str.strip()
-    df.columns = df.columns.str.replace(r'\s+', ' ', regex=True)
+    # Load cleaned dataset (cached across reruns and sessions)
+    with span("load"):
+        dataset = active_dataset()
+        df = load_data(dataset)
+        version = dataset.version
+    st.sidebar.caption(f"Dataset: **{dataset.name}**")
 
     if 'Target' in df.columns:
-        # Select numeric columns only
-        df_numeric = df.select_dtypes(include=['int64', 'float64']).copy()
-        df_numeric['Target'] = df['Target'].astype('category').cat.codes
+        # Pearson comes from cached sufficient statistics, the other measures from one
+        # batched pass per data version; widget reruns never rescan the rows
+        with span("aggregate"):
+            stats = correlation_stats(df, version)
+            associations = feature_associations(df, version)
+        feature_options = numeric_columns(df)
 
         # Sidebar controls for interactivity
         st.sidebar.header("Settings")
+        measure = st.sidebar.selectbox(
+            "Association measure", list(MEASURES), format_func=MEASURES.get,
+            index=list(MEASURES).index(FEATURE_ANALYSIS_MEASURE)
+        )
         selected_features = st.sidebar.multiselect(
             "Select numeric features to analyze",
-            options=df_numeric.columns.tolist(),
-            default=df_numeric.columns.tolist()
+            options=feature_options,
+            default=feature_options
         )
 
         show_abs = st.sidebar.checkbox("Show absolute correlation?", value=True)
         sort_desc = st.sidebar.checkbox("Sort by correlation descending?", value=True)
 
-        if len(selected_features) > 1:
-            # Compute correlation with Target
-            corr = df_numeric[selected_features].corr()['Target']
-
-            if show_abs:
-                corr = corr.abs()
+        if len(selected_features) > 0:
+            with span("transform"):
+                # Association of each selected feature with Target
+                corr = target_associations(stats, associations, measure, selected_features, show_abs, sort_desc)
 
-            if sort_desc:
-                corr = corr.sort_values(ascending=False)
+            st.write(f"### {MEASURES[measure]} with Target")
+            with span("render"):
+                st.dataframe(
+                    corr.to_frame().style.background_gradient(cmap='coolwarm').format(precision=2),
+                    height=400
+                )
 
-            st.write("### Correlation with Target")
-            st.dataframe(
-                corr.to_frame().style.background_gradient(cmap='coolwarm').format(precision=2),
-                height=400
-            )
-
-            # Plot top N correlations using Matplotlib
+            # Plot top N features using Matplotlib
             top_n = st.sidebar.slider(
                 "Select number of top features to plot",
-                min_value=1, max_value=len(corr)-1, value=5
+                min_value=1, max_value=max(len(corr), 2), value=min(FEATURE_ANALYSIS_TOP_N, len(corr))
             )
-            top_corr = corr.drop('Target').head(top_n)
 
-            st.write("### Top Correlated Features (Bar Chart)")
-            fig, ax = plt.subplots(figsize=(8, 4))
-            top_corr.plot(kind='bar', color='skyblue', ax=ax)
-            ax.set_ylabel('Correlation with Target')
-            ax.set_xlabel('Features')
-            ax.set_title('Top Correlated Features')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            st.pyplot(fig)
+            st.write("### Top Associated Features (Bar Chart)")
+            show_chart(version, top_associations_chart(corr, measure, selected_features, show_abs, sort_desc, top_n))
 
         else:
-            st.warning("Please select at least 2 features to analyze correlation.")
+            st.warning("Please select at least 1 feature to analyze.")
     else:
         st.info("No Target column found in the dataset.")
 
 except FileNotFoundError:
     st.error(f"Dataset not found at: `{STUDENT_DATA_PATH}`")
+
+end_page_trace()
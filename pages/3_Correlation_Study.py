@@ -1,23 +1,32 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 from config import STUDENT_DATA_PATH
+from utils.chart_specs import HEATMAP_SIZE, HEATMAP_TOP_N, heatmap_chart, study_features, top_correlated
+from utils.correlation import correlation_stats
+from utils.data_loader import active_dataset, load_data
+from utils.figure_cache import show_chart
+from utils.tracing import end_page_trace, span, start_page_trace
+from utils.warmup import start_warmup
 
 st.title("Correlation Study (Interactive)")
+start_page_trace("Correlation Study")
+start_warmup()
 
 try:
-    # Load and clean dataset
-    df = pd.read_csv(STUDENT_DATA_PATH, sep=';', skipinitialspace=True)
-    df.columns = df.columns.str.strip()
-    df.columns = df.columns.str.replace(r'\s+', ' ', regex=True)
+    # Load cleaned dataset (cached across reruns and sessions)
+    with span("load"):
+        dataset = active_dataset()
+        df = load_data(dataset)
+        version = dataset.version
+    st.sidebar.caption(f"Dataset: **{dataset.name}**")
+
+    # Correlations come from cached sufficient statistics, rows are not rescanned
+    with span("aggregate"):
+        stats = correlation_stats(df, version)
 
     # Sidebar for interactivity
     st.sidebar.header("Settings")
     
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    exclude_cols = ['Application order', 'Unemployment rate', 'Inflation rate', 'GDP']
-    numeric_cols = [col for col in numeric_cols if col not in exclude_cols]
+    numeric_cols = study_features(df)
 
     selected_features = st.sidebar.multiselect(
         "Select numeric features for correlation",
@@ -26,38 +35,20 @@ try:
     )
 
     show_abs = st.sidebar.checkbox("Show absolute correlation?", value=True)
-    top_n = st.sidebar.slider("Number of top features to display", 1, min(len(selected_features), 15), 10)
-    figsize_x = st.sidebar.slider("Figure width", 5, 20, 10)
-    figsize_y = st.sidebar.slider("Figure height", 5, 15, 6)
+    top_n = st.sidebar.slider("Number of top features to display", 1, min(len(selected_features), 15), HEATMAP_TOP_N)
+    figsize_x = st.sidebar.slider("Figure width", 5, 20, HEATMAP_SIZE[0])
+    figsize_y = st.sidebar.slider("Figure height", 5, 15, HEATMAP_SIZE[1])
 
     if len(selected_features) > 1:
-        df_corr = df[selected_features].copy()
-
-        # Include Target if exists
-        if 'Target' in df.columns:
-            df_corr['Target'] = df['Target'].astype('category').cat.codes
-            corr_matrix = df_corr.corr()
-            corr_with_target = corr_matrix['Target']
-
-            if show_abs:
-                corr_with_target = corr_with_target.abs()
-
-            top_features = corr_with_target.sort_values(ascending=False).head(top_n).index.tolist()
-            df_top = df_corr[top_features]
-        else:
-            corr_matrix = df_corr.corr()
-            if show_abs:
-                corr_matrix = corr_matrix.abs()
-            mean_corr = corr_matrix.mean().sort_values(ascending=False)
-            top_features = mean_corr.head(top_n).index.tolist()
-            df_top = df_corr[top_features]
+        with span("transform"):
+            # Rank by correlation with Target if it exists, else by mean correlation
+            target = 'Target' if 'Target' in df.columns else None
+            corr_matrix, top_features = top_correlated(stats, selected_features, show_abs, top_n, target)
 
         # Plot heatmap
         st.write("### Correlation Heatmap")
-        plt.figure(figsize=(figsize_x, figsize_y))
-        sns.heatmap(df_top.corr(), annot=True, fmt=".2f", cmap='coolwarm', linewidths=0.5)
-        st.pyplot(plt.gcf())
-        plt.clf()
+        show_chart(version, heatmap_chart(corr_matrix, top_features, selected_features, show_abs, top_n,
+                                          (figsize_x, figsize_y)))
 
         st.write(f"Top correlated features displayed: **{', '.join(top_features)}**")
     else:
@@ -65,3 +56,5 @@ try:
 
 except FileNotFoundError:
     st.error(f"Dataset not found at: `{STUDENT_DATA_PATH}`")
+
+end_page_trace()
@@ -1,112 +1,119 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 from config import STUDENT_DATA_PATH
+from utils import chart_specs
+from utils.bitmap_index import bitmap_index
+from utils.cube import aggregate_cube
+from utils.data_loader import active_dataset, load_data
+from utils.figure_cache import show_chart
+from utils.tracing import end_page_trace, span, start_page_trace
+from utils.warmup import start_warmup
 
 st.title("Exploratory Data Analysis (EDA) & Insights")
+start_page_trace("EDA Insights")
+start_warmup()
 
 try:
-    # Load and clean dataset
-    df = pd.read_csv(STUDENT_DATA_PATH, sep=';', skipinitialspace=True)
-    df.columns = df.columns.str.strip()
-    df.columns = df.columns.str.replace(r'\s+', ' ', regex=True)
-
-    # Encode Target if present
-    if 'Target' in df.columns:
-        df['Target_encoded'] = df['Target'].astype('category').cat.codes
+    # Load cleaned dataset (cached across reruns and sessions)
+    with span("load"):
+        dataset = active_dataset()
+        df = load_data(dataset)
+        version = dataset.version
+    st.sidebar.caption(f"Dataset: **{dataset.name}**")
+
+    with span("aggregate"):
+        # Counts, sums and sums of squares per Target/Gender/... cell, built once per data version
+        cube = aggregate_cube(df, version)
+        # Per-value row bitmaps, filters resolve to row positions instead of filtered copies
+        index = bitmap_index(df, version)
 
     # Sidebar filters
     st.sidebar.header("Filters & Options")
+    filters = {}
 
     # Filter by Target
     if 'Target' in df.columns:
         selected_target = st.sidebar.multiselect(
-            "Select Target", df['Target'].unique(), default=df['Target'].unique()
+            "Select Target", cube.levels('Target'), default=cube.levels('Target')
         )
-        df = df[df['Target'].isin(selected_target)]
+        filters['Target'] = selected_target
 
     # Filter by Gender
     if 'Gender' in df.columns:
         selected_gender = st.sidebar.multiselect(
-            "Select Gender", df['Gender'].unique(), default=df['Gender'].unique()
+            "Select Gender", cube.levels('Gender'), default=cube.levels('Gender')
         )
-        df = df[df['Gender'].isin(selected_gender)]
-
-    # Sidebar slider for pairplot sample size
-    pairplot_sample = st.sidebar.slider(
-        "Pairplot sample size", min_value=50, max_value=200, value=150
+        filters['Gender'] = selected_gender
+
+    # Charts below that only need counts or moments read them from the filtered cube cells,
+    # the rest gather just the columns they plot at the selected row positions.
+    # Every chart is served from the figure cache when the same filters were seen before.
+    with span("transform"):
+        matches = index.count(filters)
+        st.sidebar.caption(f"{matches} students match the filters")
+        cube = cube.slice(filters)
+        selection = index.select(filters)
+
+    # Interactive charts ship only pre-binned / pre-aggregated arrays to the browser
+    chart_backend = st.sidebar.radio("Chart backend", ["Interactive (Plotly)", "Static (matplotlib)"])
+    interactive = chart_backend == "Interactive (Plotly)"
+
+    # Pairplot over every matching student (binned) or over a sample of rows
+    pairplot_mode = st.sidebar.radio(
+        "Pairplot mode", ["Full population (binned)", "Sample (pairplot)"]
     )
-
-    # Target Distribution
-    st.subheader("Target Distribution")
-    if 'Target' in df.columns:
-        plt.figure(figsize=(6, 4))
-        sns.countplot(x='Target', data=df, palette='pastel')
-        plt.title("Target Distribution (Success vs Dropout)")
-        st.pyplot(plt.gcf())
-        plt.clf()
-    else:
-        st.info("No 'Target' column found in dataset.")
-
-    # Gender vs Target
-    if 'Gender' in df.columns and 'Target' in df.columns:
-        st.subheader("Gender vs Target")
-        plt.figure(figsize=(6, 4))
-        sns.countplot(x='Gender', hue='Target', data=df, palette='Set2')
-        plt.title("Gender Comparison by Target")
-        st.pyplot(plt.gcf())
-        plt.clf()
-
-    # Age Distribution
-    if 'Age at enrollment' in df.columns:
-        st.subheader("Age Distribution")
-        gender_map = {0: 'Male', 1: 'Female'}
-        df_plot = df.copy()
-        df['Gender_label'] = df['Gender'].map(gender_map).fillna(df['Gender'])
-        plt.figure(figsize=(6, 4))
-        sns.histplot(df['Age at enrollment'], kde=True, color='green', bins=20)
-        plt.title("Age at Enrollment Distribution")
-        st.pyplot(plt.gcf())
-        plt.clf()
-
-    # Mean ± SD Bar Plots for Top Correlated Features
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    exclude_cols = ['Application order', 'Unemployment rate', 'Inflation rate', 'GDP']
-    numeric_cols = [col for col in numeric_cols if col not in exclude_cols]
-
-    if 'Target_encoded' in df.columns and len(numeric_cols) > 1:
-        df_numeric = df[numeric_cols + ['Target_encoded']].copy()
-        corr = df_numeric.corr()['Target_encoded'].abs().sort_values(ascending=False)[1:5]  # Top 4 features
-        top_corr_cols = corr.index.tolist()
-
-        st.subheader("Feature-wise Mean ± SD by Target")
-        st.caption("Displays average values of each feature across Target categories, with error bars for standard deviation.")
-
-        for col in top_corr_cols:
-            plt.figure(figsize=(6, 4))
-            sns.barplot(
-                x='Target',
-                y=col,
-                data=df,
-                palette='coolwarm',
-                ci='sd'  # Show mean ± standard deviation
-            )
-            plt.title(f"{col} by Target (Mean ± SD)")
-            st.pyplot(plt.gcf())
-            plt.clf()
-
-        # Pairplot for top correlated numeric columns (sampled)
-        st.subheader("Pairplot for Top Correlated Numeric Columns (Sample)")
-        sample_df = df[top_corr_cols[:4] + ['Target_encoded']].dropna().sample(
-            min(pairplot_sample, len(df)), random_state=30
+    if pairplot_mode == "Sample (pairplot)":
+        # Sidebar slider for pairplot sample size
+        pairplot_sample = st.sidebar.slider(
+            "Pairplot sample size", min_value=50, max_value=200, value=150
         )
-        custom_palette = ["#d30000", "#00be30", "#f9fd00"]
-        sns.pairplot(sample_df, hue='Target_encoded', palette=custom_palette, diag_kind='kde')
-        st.pyplot(plt.gcf())
-        plt.clf()
+
+    if matches == 0:
+        # Nothing to count or plot; the charts would all be empty
+        st.info("No students match the filters.")
     else:
-        st.info("Not enough numeric data for visualization.")
+        # Target Distribution
+        st.subheader("Target Distribution")
+        if 'Target' in df.columns:
+            show_chart(version, chart_specs.target_distribution_chart(cube, filters, interactive))
+        else:
+            st.info("No 'Target' column found in dataset.")
+
+        # Gender vs Target
+        if 'Gender' in df.columns and 'Target' in df.columns:
+            st.subheader("Gender vs Target")
+            show_chart(version, chart_specs.gender_vs_target_chart(cube, filters, interactive))
+
+        # Age Distribution
+        if 'Age at enrollment' in df.columns:
+            st.subheader("Age Distribution")
+            show_chart(version, chart_specs.age_histogram_chart(df, selection, filters, interactive))
+
+        # Mean ± SD Bar Plots for Top Correlated Features
+        numeric_cols = chart_specs.study_features(df)
+
+        if 'Target' in df.columns and len(numeric_cols) > 1:
+            with span("transform"):
+                top_corr_cols = chart_specs.top_target_features(cube, numeric_cols)  # Top 4 features
+
+            st.subheader("Feature-wise Mean ± SD by Target")
+            st.caption("Displays average values of each feature across Target categories, with error bars for standard deviation.")
+
+            for col in top_corr_cols:
+                show_chart(version, chart_specs.mean_sd_chart(cube, col, filters, interactive))
+
+            if pairplot_mode == "Full population (binned)":
+                # Scatter matrix for top correlated numeric columns over all matching rows
+                st.subheader("Scatter Matrix for Top Correlated Numeric Columns (All Students)")
+                st.caption("Each panel shows binned counts, coloured by the Target mix of the bin; diagonals are histograms.")
+                show_chart(version, chart_specs.scatter_matrix_chart(df, top_corr_cols[:4], selection, filters))
+            else:
+                # Pairplot for top correlated numeric columns (sampled)
+                st.subheader("Pairplot for Top Correlated Numeric Columns (Sample)")
+                show_chart(version, chart_specs.pairplot_chart(df, top_corr_cols[:4], selection, filters, pairplot_sample))
+        else:
+            st.info("Not enough numeric data for visualization.")
 
 except FileNotFoundError:
     st.error(f"Dataset not found at: `{STUDENT_DATA_PATH}`")
+
+end_page_trace()
@@ -1,25 +1,33 @@
 import streamlit as st
-import pandas as pd
 from config import STUDENT_DATA_PATH
+from utils.data_loader import active_dataset
+from utils.profiler import profile_dataset
+from utils.tracing import end_page_trace, span, start_page_trace
+from utils.warmup import start_warmup
 
 st.title("Summary Report")
+start_page_trace("Summary Report")
+start_warmup()
 
 try:
-    df = pd.read_csv(STUDENT_DATA_PATH, sep=';', skipinitialspace=True)
+    # One-pass column profile (cached, shared with the Data Overview page), no full load needed
+    dataset = active_dataset()
+    st.sidebar.caption(f"Dataset: **{dataset.name}**")
+    with span("aggregate"):
+        profile = profile_dataset(dataset)
 
-    # Clean column names
-    df.columns = df.columns.str.strip()
-    df.columns = df.columns.str.replace(r'\s+', ' ', regex=True)
+    with span("render"):
+        st.write("### Missing Values Summary")
+        st.dataframe(profile.missing().sort_values(ascending=False))
 
-    st.write("### Missing Values Summary")
-    st.dataframe(df.isna().sum().sort_values(ascending=False))
+        st.write("### Data Overview")
+        st.dataframe(profile.describe(), height=400)
 
-    st.write("### Data Overview")
-    st.dataframe(df.describe(include='all').transpose(), height=400)
-
-    st.write("### Target Value Counts")
-    if 'Target' in df.columns:
-        st.dataframe(df['Target'].value_counts())
+        st.write("### Target Value Counts")
+        if 'Target' in profile.columns:
+            st.dataframe(profile.value_counts('Target'))
 
 except FileNotFoundError:
     st.error(f"Dataset not found at: `{STUDENT_DATA_PATH}`")
+
+end_page_trace()
@@ -0,0 +1,252 @@
+"""Static HTML reports for many cohorts, without the Streamlit UI.
+
+Each report holds the Summary Report tables, the Correlation Study heatmap and
+the EDA charts (Target and Gender counts, age histogram, mean ± SD bars and
+the binned scatter matrix) at the pages' default settings, rendered from the
+same utils/chart_specs.py charts the pages show. Cohorts are either the partitions of one dataset
+by one or more columns, or a list of dataset files::
+
+    python -m reports.generate_reports --partition Course
+    python -m reports.generate_reports --datasets data/student_data.csv data/student_data.xlsx
+
+Cohorts are spread over a process pool. For partitions every worker loads the
+dataset once (from its Parquet snapshot) and cuts cohorts out of it by row
+position; within a report all sections share one set of statistics computed
+from the cohort's rows.
+"""
+import argparse
+import base64
+import html
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from config import STUDENT_DATA_PATH
+from utils import chart_specs
+from utils.correlation import CorrelationStats
+from utils.cube import CUBE_DIMENSIONS, AggregateCube
+from utils.data_loader import data_version, file_format, read_dataset
+from utils.figure_cache import figure_to_png
+from utils.profiler import profile_frame
+from utils.schema import numeric_columns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }
+table { border-collapse: collapse; font-size: 13px; margin-bottom: 1.5em; }
+th, td { border: 1px solid #ccc; padding: 3px 8px; text-align: right; }
+img { max-width: 100%; margin-bottom: 1.5em; }
+"""
+
+# The dataset partitions are cut from, loaded once per worker process
+_frame = None
+
+
+def load_dataset(path):
+    """Cleaned frame of a CSV/XLSX file, parsed once and then read from its snapshot."""
+    return read_dataset(data_version(path), os.path.abspath(path), file_format(path))
+
+
+def _image(chart):
+    # Static charts only; every row of the cohort, so there is no filter or cache to go through
+    png = figure_to_png(chart.render())
+    return f'<img src="data:image/png;base64,{base64.b64encode(png).decode()}">'
+
+
+def _table(frame):
+    return frame.to_html(float_format=lambda v: f"{v:,.3f}", na_rep="")
+
+
+def summary_section(profile):
+    parts = ["<h2>Summary Report</h2>",
+             "<h3>Missing Values Summary</h3>", _table(profile.missing().sort_values(ascending=False).to_frame()),
+             "<h3>Data Overview</h3>", _table(profile.describe())]
+    if 'Target' in profile.columns:
+        parts += ["<h3>Target Value Counts</h3>", _table(profile.value_counts('Target').to_frame())]
+    return parts
+
+
+def correlation_section(df, stats):
+    features = chart_specs.study_features(df)
+    target = 'Target' if 'Target' in df.columns else None
+    corr_matrix, top = chart_specs.top_correlated(stats, features, target=target)
+    return ["<h2>Correlation Study</h2>",
+            _image(chart_specs.heatmap_chart(corr_matrix, top, features, True, chart_specs.HEATMAP_TOP_N)),
+            f"<p>Top correlated features: {html.escape(', '.join(top))}</p>"]
+
+
+def eda_section(df, cube):
+    # As on the EDA page: the Target and Gender charts, mean ± SD bars and scatter matrix
+    # need Target (``cube`` is None without it), the age histogram does not
+    filters = chart_specs.all_levels(cube) if cube is not None else {}
+    parts = ["<h2>EDA &amp; Insights</h2>"]
+    if cube is not None:
+        parts.append(_image(chart_specs.target_distribution_chart(cube, filters, False)))
+        if 'Gender' in cube.dimensions:
+            parts.append(_image(chart_specs.gender_vs_target_chart(cube, filters, False)))
+    else:
+        parts.append("<p>No 'Target' column found in dataset.</p>")
+    if 'Age at enrollment' in df.columns:
+        parts.append(_image(chart_specs.age_histogram_chart(df, None, filters, False)))
+    features = chart_specs.study_features(df)
+    if cube is not None and len(features) > 1:
+        top = chart_specs.top_target_features(cube, features)
+        parts.append("<h3>Feature-wise Mean ± SD by Target</h3>")
+        for col in top:
+            parts.append(_image(chart_specs.mean_sd_chart(cube, col, filters, False)))
+        parts += ["<h3>Scatter Matrix for Top Correlated Numeric Columns</h3>",
+                  _image(chart_specs.scatter_matrix_chart(df, top, None, filters))]
+    return parts
+
+
+def build_report(name, df):
+    """HTML report for one cohort; the sections share the statistics computed here."""
+    features = numeric_columns(df)
+    has_target = 'Target' in df.columns
+    stats = CorrelationStats.from_frame(df, features + ['Target'] if has_target else features)
+    cube = None
+    if has_target:
+        cube = AggregateCube.from_frame(df, [dim for dim in CUBE_DIMENSIONS if dim in df.columns], features)
+    profile = profile_frame(df)
+    body = [f"<h1>{html.escape(name)}</h1>",
+            f"<p>{len(df):,} students &middot; generated {datetime.now(timezone.utc):%Y-%m-%d %H:%M} UTC</p>",
+            *summary_section(profile), *correlation_section(df, stats), *eda_section(df, cube)]
+    return _page(name, body)
+
+
+def _page(title, body):
+    return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>"
+            f"<style>{_STYLE}</style></head><body>\n" + "\n".join(body) + "\n</body></html>\n")
+
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9._=-]+', '_', name).strip('_')
+
+
+def _write(out_dir, name, document):
+    filename = f"{_slug(name)}.html"
+    with open(os.path.join(out_dir, filename), 'w', encoding='utf-8') as f:
+        f.write(document)
+    return filename
+
+
+def _init_worker(path):
+    global _frame
+    _frame = load_dataset(path) if path else None
+
+
+def _partition_report(name, positions, out_dir):
+    start = time.perf_counter()
+    cohort = _frame.take(positions)
+    filename = _write(out_dir, name, build_report(name, cohort))
+    return name, len(cohort), filename, time.perf_counter() - start
+
+
+def _dataset_report(path, out_dir):
+    start = time.perf_counter()
+    df = load_dataset(path)
+    name = os.path.basename(path)
+    filename = _write(out_dir, name, build_report(name, df))
+    return name, len(df), filename, time.perf_counter() - start
+
+
+def partition_cohorts(df, columns, min_rows):
+    """(name, row positions) per combination of the partition columns' values."""
+    cohorts = []
+    for key, positions in df.groupby(columns, observed=True).indices.items():
+        key = key if isinstance(key, tuple) else (key,)
+        if len(positions) >= min_rows:
+            cohorts.append((", ".join(f"{col}={value}" for col, value in zip(columns, key)), positions))
+    return sorted(cohorts, key=lambda cohort: cohort[0])
+
+
+def _write_index(out_dir, results):
+    rows = "\n".join(f'<tr><td style="text-align:left"><a href="{filename}">{html.escape(name)}</a></td>'
+                     f'<td>{n_rows:,}</td></tr>' for name, n_rows, filename, _ in results)
+    body = ["<h1>Cohort reports</h1>", f"<table><tr><th>Cohort</th><th>Students</th></tr>\n{rows}\n</table>"]
+    with open(os.path.join(out_dir, "index.html"), 'w', encoding='utf-8') as f:
+        f.write(_page("Cohort reports", body))
+
+
+def _print_result(result):
+    name, n_rows, _, seconds = result
+    print(f"{name:<40} {n_rows:>8,} rows  {seconds:6.2f}s")
+
+
+def _print_failure(name, exc):
+    print(f"{name:<40} FAILED: {type(exc).__name__}: {exc}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch HTML reports for many cohorts.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--partition", nargs="+", metavar="COLUMN",
+                        help="one report per combination of these columns' values (e.g. Course)")
+    source.add_argument("--datasets", nargs="+", metavar="PATH", help="one report per CSV/XLSX file")
+    parser.add_argument("--dataset", default=STUDENT_DATA_PATH, help="dataset to partition (default: config.py)")
+    parser.add_argument("--min-rows", type=int, default=10, help="skip partitions with fewer students")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--output-dir", default=os.path.join(ROOT, "reports", "output"))
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    start = time.perf_counter()
+    if args.partition:
+        # Parse once here so the workers only read the snapshot
+        df = load_dataset(args.dataset)
+        missing = [col for col in args.partition if col not in df.columns]
+        if missing:
+            parser.error(f"unknown partition column(s): {', '.join(missing)}")
+        tasks = [(name, _partition_report, (name, positions, args.output_dir))
+                 for name, positions in partition_cohorts(df, args.partition, args.min_rows)]
+        del df
+        init_path = args.dataset
+    else:
+        tasks = [(path, _dataset_report, (path, args.output_dir)) for path in args.datasets]
+        init_path = None
+
+    # A cohort that fails (unreadable file, unexpected columns...) is logged and skipped,
+    # the others still get their reports and the index
+    results, failed = [], []
+    workers = max(1, min(args.workers, len(tasks)))
+    if workers == 1:
+        _init_worker(init_path)
+        for name, func, task_args in tasks:
+            try:
+                results.append(func(*task_args))
+            except Exception as exc:
+                failed.append(name)
+                _print_failure(name, exc)
+                continue
+            _print_result(results[-1])
+    else:
+        # spawn, not fork: matplotlib and the BLAS thread pools do not survive a fork cleanly
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(init_path,)) as pool:
+            futures = [(name, pool.submit(func, *task_args)) for name, func, task_args in tasks]
+            for name, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    failed.append(name)
+                    _print_failure(name, exc)
+                    continue
+                _print_result(results[-1])
+
+    _write_index(args.output_dir, results)
+    elapsed = time.perf_counter() - start
+    print(f"{len(results)} cohort reports in {elapsed:.1f}s with {workers} worker(s): "
+          f"{len(results) / elapsed * 60:.1f} cohorts/minute -> {args.output_dir}")
+    if failed:
+        print(f"{len(failed)} cohort(s) failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
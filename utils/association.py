@@ -0,0 +1,124 @@
+"""Feature–Target association measures from per-class aggregates.
+
+Pearson correlation against ``Target``'s category codes depends on an
+arbitrary ordering of Dropout/Enrolled/Graduate. This engine adds measures
+that suit a nominal three-class target. Each feature goes through:
+
+* a ranking stage (average ranks via ``np.unique``), which also yields the
+  discretization used for its contingency table, and
+* an ``np.bincount`` stage over class and (bin, class) keys that produces the
+  per-class counts, sums, sums of squares, rank sums and the contingency table.
+
+Features are processed one at a time, so the scratch memory is a few arrays of
+one column's length, and only the small aggregates are kept. Spearman, ANOVA F,
+mutual information and Cramér's V then follow from those aggregates for all
+features at once. Each feature counts the rows where it and Target are present,
+so one sparse column does not affect the others.
+The results agree with scipy/scikit-learn, see benchmarks/check_associations.py.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.schema import numeric_columns
+
+# Measure key -> label shown in the sidebar; Pearson is served by utils.correlation
+MEASURES = {
+    'pearson': "Pearson r (Target codes)",
+    'spearman': "Spearman ρ (Target codes)",
+    'anova_f': "ANOVA F",
+    'mutual_info': "Mutual information (nats)",
+    'cramers_v': "Cramér's V",
+}
+SIGNED_MEASURES = {'pearson', 'spearman'}
+
+# Features with more distinct values are cut into this many equal-frequency bins
+MAX_BINS = 20
+
+
+def _average_ranks(values):
+    unique, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    upper = np.cumsum(counts)
+    return (upper - (counts - 1) / 2.0)[inverse], inverse, len(unique)
+
+
+def feature_target_associations(df, features, target='Target', max_bins=MAX_BINS):
+    """DataFrame of Spearman, ANOVA F, mutual information and Cramér's V per feature."""
+    classes = df[target].cat.codes.to_numpy()
+    has_class = classes >= 0
+    k = len(features)
+    n_classes = len(df[target].cat.categories)
+
+    n = np.empty(k)
+    class_n = np.empty((k, n_classes))
+    sum_x = np.empty((k, n_classes))
+    sum_xx = np.empty((k, n_classes))
+    sum_rank = np.empty((k, n_classes))
+    sum_rank_sq = np.empty(k)
+    tables = []
+    for j, col in enumerate(features):
+        # Rows where this feature and Target are present, so a sparse column only affects itself
+        x = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        complete = has_class & ~np.isnan(x)
+        x, y = x[complete], classes[complete].astype(np.int64)
+        n[j] = len(x)
+
+        # Ranking stage: ranks for Spearman, bin codes for the contingency table
+        ranks, inverse, n_unique = _average_ranks(x)
+        if n_unique <= max_bins:
+            bins, n_bins = inverse, n_unique
+        else:
+            bins = np.minimum(((ranks - 1) * max_bins / n[j]).astype(np.int64), max_bins - 1)
+            n_bins = max_bins
+
+        # Bincount stage: per-class aggregates and the (bin, class) table
+        class_n[j] = np.bincount(y, minlength=n_classes)
+        sum_x[j] = np.bincount(y, weights=x, minlength=n_classes)
+        sum_xx[j] = np.bincount(y, weights=x * x, minlength=n_classes)
+        sum_rank[j] = np.bincount(y, weights=ranks, minlength=n_classes)
+        sum_rank_sq[j] = ranks @ ranks
+        tables.append(np.bincount(bins * n_classes + y, minlength=n_bins * n_classes)
+                      .reshape(n_bins, n_classes).astype('float64'))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Spearman: the Target rank is constant within a class
+        class_rank = np.cumsum(class_n, axis=1) - (class_n - 1) / 2.0
+        mean_rank = (n + 1) / 2.0
+        cov = (sum_rank * class_rank).sum(axis=1) / n - mean_rank ** 2
+        var_x = sum_rank_sq / n - mean_rank ** 2
+        var_y = (class_n * class_rank ** 2).sum(axis=1) / n - mean_rank ** 2
+        spearman = cov / np.sqrt(var_x * var_y)
+
+        # One-way ANOVA F across the Target classes
+        present = class_n > 0
+        total = sum_x.sum(axis=1)
+        between = np.where(present, sum_x ** 2 / class_n, 0.0).sum(axis=1) - total ** 2 / n
+        within = sum_xx.sum(axis=1) - total ** 2 / n - between
+        groups = present.sum(axis=1)
+        anova_f = (between / (groups - 1)) / (within / (n - groups))
+
+        # Mutual information and Cramér's V from each feature's contingency table
+        mutual_info = np.empty(k)
+        cramers_v = np.empty(k)
+        for j, table in enumerate(tables):
+            rows, cols = table.sum(axis=1), table.sum(axis=0)
+            expected = np.outer(rows, cols) / n[j]
+            observed = table > 0
+            terms = table[observed] / n[j] * np.log(table[observed] / expected[observed])
+            mutual_info[j] = terms.sum() if n[j] else np.nan
+            chi2 = ((table - expected) ** 2 / np.where(expected > 0, expected, np.inf)).sum()
+            dof = min((rows > 0).sum(), (cols > 0).sum()) - 1
+            cramers_v[j] = np.sqrt(chi2 / (n[j] * dof)) if dof > 0 else np.nan
+
+    return pd.DataFrame({
+        'spearman': np.clip(spearman, -1, 1),
+        'anova_f': anova_f,
+        'mutual_info': mutual_info,
+        'cramers_v': cramers_v,
+    }, index=pd.Index(features, name='Feature'))
+
+
+@st.cache_resource(show_spinner="Computing feature–target associations...", max_entries=4)
+def feature_associations(_df, version, target='Target'):
+    """Association measures for every numeric feature, per data version."""
+    return feature_target_associations(_df, numeric_columns(_df), target)
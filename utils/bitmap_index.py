@@ -0,0 +1,118 @@
+"""Bitmap indexes over the dataset's filter columns.
+
+Only the declared filter columns (the cube dimensions plus a few flags) are
+indexed, not every small-integer measurement, so the index stays a fraction
+of the frame's size. Every value of an indexed column gets a packed bitmap (one bit per row). A
+sidebar filter combination becomes OR within a column and AND across columns,
+and pages get row positions instead of filtered copies of the frame. Counts
+per filter combination are cached on the index. Missing values get no bitmap,
+so rows with a missing value never match a filter on that column.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.cube import CUBE_DIMENSIONS
+
+# Columns the pages filter on, or may offer as filters
+FILTER_COLUMNS = CUBE_DIMENSIONS + ['Debtor', 'International']
+
+# Columns with more distinct values than this are not worth a bitmap each
+MAX_CARDINALITY = 64
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class RowSelection:
+    """Rows matching a filter combination, as a packed bitmap."""
+
+    def __init__(self, bits, n_rows):
+        self.bits = bits
+        self.n_rows = n_rows
+
+    def count(self):
+        return int(_POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def positions(self):
+        """Row positions (for ``iloc``/NumPy indexing) of the selected rows."""
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.n_rows))
+
+    def take(self, df, columns, positions=None):
+        """Gather only ``columns`` of the selected (or given) rows."""
+        positions = self.positions() if positions is None else positions
+        return df[columns].iloc[positions]
+
+
+def _covered_rows(column_bitmaps, n_rows):
+    if not column_bitmaps:
+        return 0
+    return RowSelection(np.bitwise_or.reduce(list(column_bitmaps.values())), n_rows).count()
+
+
+class BitmapIndex:
+    """One bitmap per value of each indexed column."""
+
+    def __init__(self, n_rows, bitmaps):
+        self.n_rows = n_rows
+        self.bitmaps = bitmaps  # {column: {value: packed uint8 bitmap}}
+        self._all_rows = np.packbits(np.ones(n_rows, dtype=bool))
+        # Columns whose value bitmaps cover every row, i.e. without missing values
+        self._complete = {column for column, column_bitmaps in bitmaps.items()
+                          if _covered_rows(column_bitmaps, n_rows) == n_rows}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, columns=None):
+        if columns is None:
+            # Any dtype: an integer code column with missing values is kept as float
+            columns = [col for col in FILTER_COLUMNS
+                       if col in df.columns and df[col].nunique() <= MAX_CARDINALITY]
+        bitmaps = {}
+        for col in columns:
+            # Missing values get code -1 and so no bitmap
+            codes, values = pd.factorize(df[col], sort=True)
+            bitmaps[col] = {
+                value.item() if hasattr(value, 'item') else value: np.packbits(codes == i)
+                for i, value in enumerate(values)
+            }
+        return cls(len(df), bitmaps)
+
+    def values(self, column):
+        return list(self.bitmaps[column])
+
+    def select(self, filters):
+        """Rows matching ``{column: allowed values}`` for the indexed columns."""
+        bits = self._all_rows
+        for column, allowed in filters.items():
+            if column not in self.bitmaps:
+                raise KeyError(f"{column!r} is not indexed (not a low-cardinality column)")
+            column_bitmaps = self.bitmaps[column]
+            allowed = [value for value in allowed if value in column_bitmaps]
+            if len(allowed) == len(column_bitmaps) and column in self._complete:
+                continue  # every row allowed, nothing to intersect
+            if allowed:
+                matching = np.bitwise_or.reduce([column_bitmaps[value] for value in allowed])
+            else:
+                matching = np.zeros_like(bits)
+            bits = bits & matching
+        return RowSelection(bits, self.n_rows)
+
+    def count(self, filters):
+        """Number of matching rows, cached per filter combination."""
+        key = tuple(sorted((column, tuple(sorted(allowed))) for column, allowed in filters.items()))
+        with self._lock:
+            if key in self._counts:
+                return self._counts[key]
+        count = self.select(filters).count()
+        with self._lock:
+            self._counts[key] = count
+        return count
+
+
+@st.cache_resource(show_spinner="Indexing dataset...", max_entries=4)
+def bitmap_index(_df, version):
+    """Bitmap index over the filter columns present in the data, per data version."""
+    return BitmapIndex.from_frame(_df)
@@ -0,0 +1,163 @@
+"""The charts the pages draw: cache name, cache parameters and how to render them.
+
+Each function returns a ``ChartSpec`` for one chart at given widget values.
+The pages show it through the figure cache, the warm-up thread pre-renders it
+at the widget defaults below, and the batch reports render it to a PNG, so a
+chart's name, parameters, feature selection, titles and palettes are defined
+here once. ``render`` is only called on a figure-cache miss.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from utils import charts, plotly_charts
+from utils.association import MEASURES, SIGNED_MEASURES
+from utils.scatter_matrix import binned_scatter_matrix
+from utils.schema import numeric_columns
+
+# interactive: a Plotly figure (cached as JSON) rather than a matplotlib one (cached as PNG)
+ChartSpec = namedtuple('ChartSpec', ['name', 'params', 'render', 'interactive'])
+
+# Macro-economic and ordering columns left out of the Correlation Study and EDA pages
+EXCLUDED_FEATURES = ['Application order', 'Unemployment rate', 'Inflation rate', 'GDP']
+
+# Widget defaults shared by the pages and the warm-up
+FEATURE_ANALYSIS_MEASURE = 'pearson'
+FEATURE_ANALYSIS_TOP_N = 5
+HEATMAP_TOP_N = 10
+HEATMAP_SIZE = (10, 6)
+EDA_TOP_FEATURES = 4
+
+# Dropout / Enrolled / Graduate
+TARGET_PALETTE = ["#d30000", "#00be30", "#f9fd00"]
+
+
+def study_features(df):
+    """Numeric columns shown on the Correlation Study and EDA pages."""
+    return [col for col in numeric_columns(df) if col not in EXCLUDED_FEATURES]
+
+
+def _positions(selection):
+    # None means every row, so the chart reads whole columns without a gather
+    if selection is None or selection.count() == selection.n_rows:
+        return None
+    return selection.positions()
+
+
+# Feature Analysis
+
+def target_associations(stats, associations, measure, features, show_abs=True, sort_desc=True):
+    """Association of each feature with Target under ``measure``, as shown in the table."""
+    if measure == 'pearson':
+        corr = stats.corr_with('Target', features).drop('Target')
+    else:
+        corr = associations.loc[features, measure]
+    corr = corr.rename(MEASURES[measure])
+    if show_abs and measure in SIGNED_MEASURES:
+        corr = corr.abs()
+    if sort_desc:
+        corr = corr.sort_values(ascending=False)
+    return corr
+
+
+def top_associations_chart(corr, measure, features, show_abs, sort_desc, top_n):
+    return ChartSpec(
+        'feature_analysis_top_corr',
+        {'measure': measure, 'features': features, 'show_abs': show_abs, 'sort_desc': sort_desc, 'top_n': top_n},
+        lambda: charts.correlation_bar(corr.head(top_n), ylabel=f"{MEASURES[measure]} with Target"),
+        False,
+    )
+
+
+# Correlation Study
+
+def top_correlated(stats, features, show_abs=True, top_n=HEATMAP_TOP_N, target='Target'):
+    """Correlation matrix of the features (plus ``target`` if given) and its top features.
+
+    With a target the features rank by their correlation with it, otherwise by
+    their mean correlation with the others.
+    """
+    if target:
+        corr_matrix = stats.corr(features + [target])
+        ranking = corr_matrix[target].abs() if show_abs else corr_matrix[target]
+    else:
+        corr_matrix = stats.corr(features)
+        ranking = (corr_matrix.abs() if show_abs else corr_matrix).mean()
+    return corr_matrix, ranking.sort_values(ascending=False).head(top_n).index.tolist()
+
+
+def heatmap_chart(corr_matrix, top_features, features, show_abs, top_n, figsize=HEATMAP_SIZE):
+    return ChartSpec(
+        'correlation_heatmap',
+        {'features': features, 'show_abs': show_abs, 'top_n': top_n, 'figsize': figsize},
+        lambda: charts.correlation_heatmap(corr_matrix.loc[top_features, top_features], figsize),
+        False,
+    )
+
+
+# EDA & Insights; ``filters`` are the sidebar filters the cube and selection were cut with
+
+def all_levels(cube):
+    """The EDA filters' default: every Target and Gender value."""
+    return {dim: cube.levels(dim) for dim in ('Target', 'Gender') if dim in cube.dimensions}
+
+
+def top_target_features(cube, features, n=EDA_TOP_FEATURES):
+    """The ``n`` features most correlated (in absolute value) with Target."""
+    return cube.corr_with_dimension('Target', features).abs().sort_values(ascending=False)[:n].index.tolist()
+
+
+def target_distribution_chart(cube, filters, interactive):
+    title = "Target Distribution (Success vs Dropout)"
+    if interactive:
+        render = lambda: plotly_charts.count_bars(cube.row_counts('Target'), 'Target', title, 'Pastel')
+    else:
+        render = lambda: charts.count_bars(cube.row_counts('Target'), 'Target', title, 'pastel')
+    return ChartSpec('eda_target_distribution', filters, render, interactive)
+
+
+def gender_vs_target_chart(cube, filters, interactive):
+    builder = plotly_charts if interactive else charts
+    return ChartSpec('eda_gender_vs_target', filters, lambda: builder.grouped_count_bars(
+        cube.row_counts(['Gender', 'Target']), 'Gender', 'Target', "Gender Comparison by Target", 'Set2'
+    ), interactive)
+
+
+def age_histogram_chart(df, selection, filters, interactive):
+    title = "Age at Enrollment Distribution"
+
+    def ages():
+        values = df['Age at enrollment'].to_numpy()
+        positions = _positions(selection)
+        return values if positions is None else values[positions]
+
+    if interactive:
+        render = lambda: plotly_charts.histogram(plotly_charts.histogram_bins(ages()), title, 'green')
+    else:
+        render = lambda: charts.histogram(ages(), title, 'green')
+    return ChartSpec('eda_age_histogram', filters, render, interactive)
+
+
+def mean_sd_chart(cube, feature, filters, interactive):
+    builder = plotly_charts if interactive else charts
+    return ChartSpec(f'eda_mean_sd:{feature}', filters, lambda: builder.mean_sd_bars(
+        cube.moments(feature, 'Target'), 'Target', feature, f"{feature} by Target (Mean ± SD)"
+    ), interactive)
+
+
+def scatter_matrix_chart(df, columns, selection, filters):
+    return ChartSpec('eda_scatter_matrix', filters, lambda: binned_scatter_matrix(
+        df, columns, 'Target', TARGET_PALETTE, _positions(selection)
+    ), False)
+
+
+def pairplot_chart(df, columns, selection, filters, sample_size, seed=30):
+    def render():
+        positions = selection.positions()
+        rng = np.random.default_rng(seed)
+        sample_positions = np.sort(rng.choice(positions, min(sample_size, len(positions)), replace=False))
+        sample_df = selection.take(df, columns + ['Target'], sample_positions).dropna()
+        sample_df = sample_df.assign(Target_encoded=sample_df['Target'].cat.codes).drop(columns='Target')
+        return charts.pairplot(sample_df, 'Target_encoded', TARGET_PALETTE)
+
+    return ChartSpec('eda_pairplot', {**filters, 'sample': sample_size}, render, False)
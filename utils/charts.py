@@ -0,0 +1,100 @@
+"""Figure builders shared by the pages.
+
+Each function takes already aggregated data and returns a matplotlib Figure,
+so the pages can hand them to the figure cache and only render on a miss.
+Figures are created without pyplot (except for seaborn's pairplot), which
+keeps them independent of pyplot's global current-figure state. matplotlib
+and seaborn are imported on first use, so importing this module is cheap and
+pages served from the figure cache never load them.
+"""
+
+
+def correlation_bar(top_corr, ylabel='Correlation with Target', title='Top Correlated Features'):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    top_corr.plot(kind='bar', color='skyblue', ax=ax)
+    ax.set_ylabel(ylabel)
+    ax.set_xlabel('Features')
+    ax.set_title(title)
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    fig.tight_layout()
+    return fig
+
+
+def correlation_heatmap(corr_matrix, figsize):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    sns.heatmap(corr_matrix, annot=True, fmt=".2f", cmap='coolwarm', linewidths=0.5, ax=ax)
+    return fig
+
+
+def count_bars(counts, xlabel, title, palette):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    labels = counts.index.astype(str)
+    sns.barplot(x=labels, y=counts.values, hue=labels, palette=palette, legend=False, ax=ax)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('count')
+    ax.set_title(title)
+    return fig
+
+
+def grouped_count_bars(counts, x, hue, title, palette):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    data = counts.rename('count').reset_index()
+    sns.barplot(x=x, y='count', hue=hue, data=data, palette=palette, ax=ax)
+    ax.set_title(title)
+    return fig
+
+
+def histogram(values, title, color, bins=20, kde=True):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    sns.histplot(values, kde=kde, color=color, bins=bins, ax=ax)
+    ax.set_title(title)
+    return fig
+
+
+def mean_sd_bars(moments, xlabel, ylabel, title):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    ax.bar(
+        moments.index.astype(str),
+        moments['mean'],
+        yerr=moments['std'],  # Show mean ± standard deviation
+        color=sns.color_palette('coolwarm', len(moments)),
+        error_kw={'ecolor': '.26', 'elinewidth': 2.5}
+    )
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    return fig
+
+
+def pairplot(sample_df, hue, palette):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    grid = sns.pairplot(sample_df, hue=hue, palette=palette, diag_kind='kde')
+    plt.close(grid.figure)  # detach from pyplot, the cache keeps only the PNG
+    return grid.figure
@@ -0,0 +1,119 @@
+"""Pearson correlations served from precomputed sufficient statistics.
+
+``CorrelationStats`` keeps, for every pair of columns, the number of rows
+where both are present, each column's mean over those rows and the centered
+sums of squares and cross-products (co-moments). That is the same information
+as the pairwise sums, sums of squares and cross-products, but stays accurate
+when the raw sums get large. Like ``DataFrame.corr()``, each pair uses its own
+complete rows, so a column with missing values only affects its own pairs.
+Any subset's correlation matrix is then an O(k^2) lookup, and a new batch of
+students is folded in without touching the rows already counted.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.schema import numeric_columns
+
+# Rows per block when folding in a batch, bounds the float64 scratch matrix
+_BLOCK_ROWS = 50_000
+
+
+class CorrelationStats:
+    """Running pairwise counts, means and co-moments for a fixed list of columns."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+        k = len(self.columns)
+        self.n = np.zeros((k, k))         # rows where both columns are present
+        self.mean = np.zeros((k, k))      # mean of the row column over those rows
+        self.sumsq = np.zeros((k, k))     # centered sum of squares of the row column over those rows
+        self.comoment = np.zeros((k, k))  # centered cross-products over those rows
+        # Categories of categorical columns (Target), fixed by the first batch that has
+        # them; later batches are coded against the same list so the codes stay stable
+        self.categories = {}
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        return cls(columns).update(df)
+
+    def update(self, batch):
+        """Fold a DataFrame of new rows into the statistics (returns self)."""
+        for start in range(0, len(batch), _BLOCK_ROWS):
+            self._update_block(self._as_matrix(batch.iloc[start:start + _BLOCK_ROWS]))
+        return self
+
+    def _as_matrix(self, batch):
+        # Categorical columns count by their codes, missing values stay NaN
+        arrays = []
+        for col in self.columns:
+            series = batch[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                known = self.categories.setdefault(col, [])
+                known += [value for value in series.cat.categories if value not in known]
+                codes = pd.Categorical(series, categories=known).codes
+                arrays.append(np.where(codes >= 0, codes, np.nan))
+            else:
+                arrays.append(series.to_numpy(dtype='float64', na_value=np.nan))
+        return np.column_stack(arrays) if arrays else np.empty((len(batch), 0))
+
+    def _update_block(self, block):
+        present = ~np.isnan(block)
+        if not present.any():
+            return
+        # Shift by the column means first so the block sums below stay small
+        counts = present.sum(axis=0)
+        shift = np.where(present, block, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        centered = np.where(present, block - shift, 0.0)
+        mask = present.astype('float64')
+
+        n = mask.T @ mask
+        sums = centered.T @ mask  # [i, j]: sum of column i over the rows where i and j are present
+        with np.errstate(divide='ignore', invalid='ignore'):
+            block_mean = np.where(n > 0, sums / n, 0.0)
+        block_sumsq = (centered ** 2).T @ mask - sums * block_mean
+        block_comoment = centered.T @ centered - sums * block_mean.T
+        block_mean += shift[:, None]
+
+        # Chan et al. pairwise update, element by element over the column pairs
+        total = self.n + n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where(total > 0, self.n * n / total, 0.0)
+            share = np.where(total > 0, n / total, 0.0)
+        delta = block_mean - self.mean
+        self.comoment += block_comoment + delta * delta.T * weight
+        self.sumsq += block_sumsq + delta ** 2 * weight
+        self.mean += delta * share
+        self.n = total
+
+    def corr(self, columns=None):
+        """Pearson correlation matrix of the given columns (default: all)."""
+        columns = self.columns if columns is None else list(columns)
+        idx = np.ix_(*[[self._positions[col] for col in columns]] * 2)
+        sumsq = self.sumsq[idx]
+        denominator = np.sqrt(sumsq * sumsq.T)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrix = self.comoment[idx] / denominator
+        # Pairs where either column is constant (or absent) have no defined correlation,
+        # as in DataFrame.corr()
+        matrix[~(denominator > 0)] = np.nan
+        matrix = np.clip(matrix, -1, 1)
+        np.fill_diagonal(matrix, np.where(np.diag(sumsq) > 0, 1.0, np.nan))
+        return pd.DataFrame(matrix, index=columns, columns=columns)
+
+    def corr_with(self, target, columns=None):
+        """Correlation of each column with ``target`` as a Series."""
+        columns = self.columns if columns is None else list(columns)
+        if target not in columns:
+            columns = columns + [target]
+        return self.corr(columns)[target]
+
+
+@st.cache_resource(show_spinner="Computing correlation statistics...", max_entries=4)
+def correlation_stats(_df, version):
+    """Statistics over every numeric column plus the encoded Target, per data version."""
+    columns = numeric_columns(_df)
+    if 'Target' in _df.columns:
+        columns.append('Target')
+    return CorrelationStats.from_frame(_df, columns)
@@ -0,0 +1,109 @@
+"""Pre-aggregated group-by cube for the EDA charts.
+
+Rows are grouped once over a few low-cardinality dimensions and every cell
+keeps the row count plus, per numeric feature, the count, sum and sum of
+squares of its non-missing values. Filters pick cube cells and the charts roll
+those cells up, so their cost depends on the number of cells rather than on
+the number of students.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.schema import numeric_columns
+
+CUBE_DIMENSIONS = ['Target', 'Gender', 'Course', 'Scholarship holder', 'Displaced']
+
+# Rows per block when aggregating, bounds the float64 copy of the features
+_BLOCK_ROWS = 200_000
+
+
+class AggregateCube:
+    """Counts, sums and sums of squares per cell of the dimension columns."""
+
+    def __init__(self, rows, counts, sums, sumsq):
+        self.rows = rows      # Series: rows per cell
+        self.counts = counts  # DataFrame: non-missing values per cell and feature
+        self.sums = sums
+        self.sumsq = sumsq
+        self.dimensions = list(rows.index.names)
+        self.features = list(sums.columns)
+
+    @classmethod
+    def from_frame(cls, df, dimensions, features):
+        # Each block is upcast to float64 and squared on its own; the per-block
+        # cells are then summed, so the scratch memory is bounded by the block
+        parts = [cls._aggregate_block(df.iloc[start:start + _BLOCK_ROWS], dimensions, features)
+                 for start in range(0, max(len(df), 1), _BLOCK_ROWS)]
+        if len(parts) == 1:
+            return cls(*parts[0])
+        levels = list(range(len(dimensions)))
+        return cls(*(pd.concat(part).groupby(level=levels, observed=True).sum() for part in zip(*parts)))
+
+    @staticmethod
+    def _aggregate_block(block, dimensions, features):
+        # Copies, so pandas does not take a float dimension for the same-named feature and drop it
+        keys = [block[dim].copy() for dim in dimensions]
+        values = block[features].astype('float64')
+        rows = block.groupby(keys, observed=True).size()
+        grouped = values.groupby(keys, observed=True)
+        counts = grouped.count()
+        sums = grouped.sum()
+        sumsq = (values ** 2).groupby(keys, observed=True).sum()
+        return rows, counts, sums, sumsq
+
+    def levels(self, dimension):
+        """Values of a dimension that occur in the data, in sorted order."""
+        return self.rows.index.get_level_values(dimension).unique().sort_values().tolist()
+
+    def slice(self, filters):
+        """Sub-cube of the cells matching ``{dimension: allowed values}``."""
+        mask = np.ones(len(self.rows), dtype=bool)
+        for dimension, allowed in filters.items():
+            mask &= self.rows.index.get_level_values(dimension).isin(list(allowed))
+        return AggregateCube(self.rows[mask], self.counts[mask], self.sums[mask], self.sumsq[mask])
+
+    def row_counts(self, by):
+        """Number of rows per combination of the ``by`` dimensions."""
+        return self.rows.groupby(level=by, observed=True).sum()
+
+    def moments(self, feature, by):
+        """Count, mean and sample standard deviation of a feature per ``by`` group."""
+        n = self.counts[feature].groupby(level=by, observed=True).sum()
+        total = self.sums[feature].groupby(level=by, observed=True).sum()
+        total_sq = self.sumsq[feature].groupby(level=by, observed=True).sum()
+        mean = total / n
+        var = (total_sq - total * mean) / (n - 1)
+        return pd.DataFrame({'count': n, 'mean': mean, 'std': np.sqrt(var.clip(lower=0))})
+
+    def corr_with_dimension(self, dimension, features=None):
+        """Pearson correlation of each feature with a dimension's category codes.
+
+        The codes are constant within a cell, so the cross-product sums follow
+        from the per-cell sums without going back to the rows.
+        """
+        features = self.features if features is None else list(features)
+        level = self.rows.index.get_level_values(dimension)
+        codes = level.codes if isinstance(level, pd.CategoricalIndex) else np.asarray(level, dtype='float64')
+        codes = pd.Series(np.asarray(codes, dtype='float64'), index=self.rows.index)
+
+        n = self.counts[features]
+        sum_x = self.sums[features]
+        sum_t = n.mul(codes, axis=0)
+        sum_tt = n.mul(codes ** 2, axis=0)
+        sum_xt = sum_x.mul(codes, axis=0)
+
+        n, sum_x, sum_xx = n.sum(), sum_x.sum(), self.sumsq[features].sum()
+        sum_t, sum_tt, sum_xt = sum_t.sum(), sum_tt.sum(), sum_xt.sum()
+        cov = sum_xt - sum_x * sum_t / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_t = sum_tt - sum_t ** 2 / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (cov / np.sqrt(var_x * var_t)).clip(-1, 1)
+
+
+@st.cache_resource(show_spinner="Aggregating dataset...", max_entries=4)
+def aggregate_cube(_df, version, dimensions=tuple(CUBE_DIMENSIONS)):
+    """Cube over the dimensions present in the data, per data version."""
+    dimensions = [dim for dim in dimensions if dim in _df.columns]
+    return AggregateCube.from_frame(_df, dimensions, numeric_columns(_df))
@@ -0,0 +1,196 @@
+"""Shared loader and ingestion for the student dataset.
+
+A dataset is a CSV (semicolon separated) or XLSX file, given as a path or
+uploaded, identified by a hash of its content. Each distinct content is
+parsed once: the cleaned frame lives in Streamlit's resource cache, so every
+rerun and every session gets the same object, and a Parquet snapshot is kept
+in DATA_CACHE_DIR so a server restart does not have to parse it again.
+Uploading the same file again is a cache hit.
+
+Each session has an active dataset (``active_dataset``): the last upload it
+activated, or else the file at STUDENT_DATA_PATH. Every page loads it, so an
+upload on the Data Overview page is used throughout the app.
+
+Pages must treat the frame as read-only; copy-on-write is switched on so
+column subsets and ``assign`` share its memory instead of copying it.
+"""
+import hashlib
+import io
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import pandas as pd
+import streamlit as st
+
+from config import DATA_CACHE_DIR, STUDENT_DATA_PATH
+from utils.schema import apply_schema
+from utils.tracing import span
+
+pd.set_option('mode.copy_on_write', True)
+
+# Bump whenever the cleanup or schema changes so stale snapshots are ignored
+SNAPSHOT_FORMAT = 2
+
+# Session state key holding the session's active Dataset
+ACTIVE_DATASET_KEY = 'active_dataset'
+_UPLOAD_ID_KEY = 'active_dataset_upload_id'
+
+# A registered dataset: content hash, display name, 'csv' or 'xlsx', and its path (None for uploads)
+Dataset = namedtuple('Dataset', ['version', 'name', 'format', 'path'])
+
+
+def clean_columns(df):
+    """Strip and collapse whitespace in the column names (in place)."""
+    df.columns = df.columns.str.strip()
+    df.columns = df.columns.str.replace(r'\s+', ' ', regex=True)
+    return df
+
+
+def file_format(name):
+    return 'xlsx' if name.lower().endswith('.xlsx') else 'csv'
+
+
+def read_student_file(source, fmt='csv'):
+    """Parse a student CSV or XLSX (first sheet) from a path or bytes, clean and type it."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    if fmt == 'xlsx':
+        df = pd.read_excel(source)  # needs openpyxl
+    else:
+        df = pd.read_csv(source, sep=';', skipinitialspace=True)
+    return apply_schema(clean_columns(df))
+
+
+@lru_cache(maxsize=32)
+def _content_hash(path, mtime_ns, size):
+    # Keyed on mtime/size so the file is only re-hashed after it changes
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def data_version(path=STUDENT_DATA_PATH):
+    """Short content hash identifying the current contents of the dataset file."""
+    stat = os.stat(path)  # raises FileNotFoundError, which the pages handle
+    return _content_hash(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def snapshot_path(version):
+    return os.path.join(DATA_CACHE_DIR, f"{version}.v{SNAPSHOT_FORMAT}.parquet")
+
+
+def read_snapshot(version):
+    """Return the Parquet snapshot for a data version, or None if there is none."""
+    snapshot = snapshot_path(version)
+    if not os.path.exists(snapshot):
+        return None
+    try:
+        return pd.read_parquet(snapshot)
+    except Exception:
+        # Truncated or unreadable snapshot: fall back to the source file
+        return None
+
+
+def write_snapshot(df, version):
+    snapshot = snapshot_path(version)
+    tmp = f"{snapshot}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, snapshot)
+    except (OSError, ImportError):
+        # Read-only deploys still work, they just re-parse after a restart
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+@st.cache_resource
+def _sources():
+    # version -> (path or uploaded bytes, format) for every dataset this process has seen;
+    # an upload's bytes are dropped once its snapshot is written
+    return {}
+
+
+def read_dataset(version, source, fmt):
+    """Frame of a data version from its snapshot, else parsed from ``source`` and snapshotted.
+
+    Uncached; the app goes through ``load_data``, batch jobs may call it directly.
+    """
+    with span("snapshot_read"):
+        df = read_snapshot(version)
+    if df is None:
+        if source is None:
+            raise FileNotFoundError(f"Dataset {version} is no longer available, upload it again")
+        with span("parse"):
+            df = read_student_file(source, fmt)
+        with span("snapshot_write"):
+            write_snapshot(df, version)
+    return df
+
+
+@st.cache_resource(show_spinner="Loading dataset...", max_entries=4)
+def _load_version(version):
+    return read_dataset(version, *_sources().get(version, (None, None)))
+
+
+def ingest_path(path):
+    """Register the CSV/XLSX file at ``path``; it is parsed on first load."""
+    version = data_version(path)
+    fmt = file_format(path)
+    _sources()[version] = (os.path.abspath(path), fmt)
+    return Dataset(version, os.path.basename(path), fmt, path)
+
+
+def ingest_upload(uploaded_file):
+    """Register and parse an uploaded CSV/XLSX, unless the same content was seen before."""
+    data = uploaded_file.getvalue()
+    version = hashlib.sha256(data).hexdigest()[:16]
+    fmt = file_format(uploaded_file.name)
+    sources = _sources()
+    if sources.get(version, (None,))[0] is None:
+        sources[version] = (data, fmt)
+    dataset = Dataset(version, uploaded_file.name, fmt, None)
+    load_data(dataset)
+    if os.path.exists(snapshot_path(version)) and isinstance(sources[version][0], bytes):
+        sources[version] = (None, fmt)
+    return dataset
+
+
+def default_dataset():
+    """The dataset at STUDENT_DATA_PATH (raises FileNotFoundError if it is missing)."""
+    return ingest_path(STUDENT_DATA_PATH)
+
+
+def active_dataset():
+    """This session's dataset: the last upload it activated, else the default file."""
+    dataset = st.session_state.get(ACTIVE_DATASET_KEY)
+    return dataset if dataset is not None else default_dataset()
+
+
+def set_active_dataset(dataset):
+    """Make ``dataset`` this session's dataset on every page (None: back to the default)."""
+    if dataset is None:
+        st.session_state.pop(ACTIVE_DATASET_KEY, None)
+    else:
+        st.session_state[ACTIVE_DATASET_KEY] = dataset
+
+
+def activate_upload(uploaded_file):
+    """Ingest a newly uploaded file and make it the active dataset.
+
+    The uploader keeps returning the same file on every rerun; it is only
+    ingested (and activated) again when a different file is uploaded.
+    """
+    if uploaded_file.file_id != st.session_state.get(_UPLOAD_ID_KEY):
+        set_active_dataset(ingest_upload(uploaded_file))
+        st.session_state[_UPLOAD_ID_KEY] = uploaded_file.file_id
+
+
+def load_data(dataset=None):
+    """Cleaned frame of ``dataset`` (default: the active one), shared read-only across sessions."""
+    if dataset is None:
+        dataset = active_dataset()
+    return _load_version(dataset.version)
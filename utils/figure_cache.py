@@ -0,0 +1,137 @@
+"""Cache of rendered figures shared by all sessions.
+
+matplotlib figures are stored as PNG bytes and Plotly figures as their JSON,
+keyed by chart name, data version and the exact chart parameters, inside a
+byte budget (``FIGURE_CACHE_BYTES``) with least-recently-used eviction.
+Repeat views of a chart are served from the cache without building it again.
+"""
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from config import FIGURE_CACHE_BYTES
+from utils.tracing import span
+
+# Same resolution as st.pyplot, capped so Streamlit never has to downscale
+_DPI = 200
+_MAX_WIDTH_PX = 1400
+
+
+class FigureCache:
+    """Byte-bounded LRU mapping of chart keys to PNG bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return  # would evict everything else, just don't keep it
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = png
+            self.size += len(png)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def get_or_render(self, key, render, encode=None):
+        """Encoded bytes for ``key`` (PNG by default), calling ``render()`` for a Figure only on a miss."""
+        data = self.get(key)
+        if data is None:
+            with span("draw"):
+                fig = render()
+            with span("encode"):
+                data = (encode or figure_to_png)(fig)
+            self.put(key, data)
+        return data
+
+
+def figure_to_png(fig):
+    width_in = fig.get_size_inches()[0]
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=min(_DPI, _MAX_WIDTH_PX / width_in), bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def plotly_to_json(fig):
+    return fig.to_json().encode()
+
+
+def _freeze(value):
+    # Turn widget values (lists, dicts) into a hashable cache key
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@st.cache_resource
+def figure_cache():
+    return FigureCache(FIGURE_CACHE_BYTES)
+
+
+def prerender_figure(name, version, params, render):
+    """Put a chart in the cache without showing it (used by the warm-up thread)."""
+    return figure_cache().get_or_render((name, version, _freeze(params)), render)
+
+
+def cached_figure(name, version, params, render):
+    """Show a chart, rendering it only if this exact chart is not cached yet."""
+    with span(f"render:{name}"):
+        png = prerender_figure(name, version, params, render)
+        st.image(png, use_column_width=True)
+
+
+def prerender_plotly_figure(name, version, params, render):
+    """Put a Plotly chart's JSON in the cache without showing it."""
+    return figure_cache().get_or_render(('plotly', name, version, _freeze(params)), render, plotly_to_json)
+
+
+def cached_plotly_figure(name, version, params, render):
+    """Show an interactive Plotly chart, building it only if it is not cached yet.
+
+    Zoom and hover stay in the browser (no selection events, so no reruns).
+    """
+    with span(f"render:{name}"):
+        payload = prerender_plotly_figure(name, version, params, render)
+        figure = json.loads(payload)
+        if not figure.get('data'):
+            # st.plotly_chart rejects a dict without traces but takes an empty Figure;
+            # parsing into a Figure costs milliseconds, so only this case pays it
+            import plotly.io
+
+            figure = plotly.io.from_json(payload)
+        st.plotly_chart(figure, use_container_width=True)
+
+
+def prerender_chart(version, chart):
+    """Put a ``ChartSpec`` (utils/chart_specs.py) in the cache without showing it."""
+    prerender = prerender_plotly_figure if chart.interactive else prerender_figure
+    return prerender(chart.name, version, chart.params, chart.render)
+
+
+def show_chart(version, chart):
+    """Show a ``ChartSpec`` through the cache, as an interactive chart or an image."""
+    show = cached_plotly_figure if chart.interactive else cached_figure
+    show(chart.name, version, chart.params, chart.render)
@@ -0,0 +1,110 @@
+"""Interactive (Plotly) versions of the EDA page's count, histogram and mean ± SD charts.
+
+The server reduces the rows to a few small arrays first (histogram bin
+counts, a binned KDE curve, per-group counts or moments) and the browser only
+receives those, so the chart payload and render time do not grow with the
+number of students. Zoom and hover happen in the browser without a rerun.
+Plotly is imported on first use, like matplotlib in utils/charts.py.
+"""
+import numpy as np
+
+# Grid points of the binned KDE curve
+KDE_POINTS = 200
+
+
+def histogram_bins(values, bins=20, kde=True):
+    """Bin counts, plus a Gaussian KDE scaled to counts, for the non-missing ``values``.
+
+    Like seaborn's ``histplot(kde=True)``: equal-width bins over the data range
+    and a Scott's-rule bandwidth. The KDE is evaluated on a grid by binning the
+    values onto it (linear binning) and convolving with the kernel, which is
+    linear in the row count.
+    """
+    values = np.asarray(values, dtype='float64')
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'edges': np.array([0.0, 1.0]), 'counts': np.array([0]), 'kde_x': None, 'kde_y': None}
+    counts, edges = np.histogram(values, bins=bins)
+    result = {'edges': edges, 'counts': counts, 'kde_x': None, 'kde_y': None}
+
+    n, lo, hi = len(values), edges[0], edges[-1]
+    bandwidth = values.std(ddof=1) * n ** (-1 / 5) if n > 1 else 0.0
+    if kde and bandwidth > 0 and hi > lo:
+        grid = np.linspace(lo, hi, KDE_POINTS)
+        step = grid[1] - grid[0]
+        # Linear binning: each value is split between its two neighbouring grid points
+        position = (values - lo) / step
+        left = np.minimum(position.astype(np.int64), KDE_POINTS - 2)
+        right_share = position - left
+        weights = (np.bincount(left, 1 - right_share, minlength=KDE_POINTS)
+                   + np.bincount(left + 1, right_share, minlength=KDE_POINTS))
+        half_width = min(int(np.ceil(4 * bandwidth / step)), 4 * KDE_POINTS)
+        offsets = np.arange(-half_width, half_width + 1) * step
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+        smoothed = np.convolve(weights, kernel, mode='full')[half_width:half_width + KDE_POINTS]
+        result['kde_x'] = grid
+        result['kde_y'] = smoothed * (edges[1] - edges[0])  # n * density * bin width: the bars' count scale
+    return result
+
+
+def count_bars(counts, xlabel, title, palette):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    colors = getattr(px.colors.qualitative, palette)
+    labels = counts.index.astype(str)
+    fig = go.Figure(go.Bar(
+        x=labels, y=counts.to_numpy(),
+        marker_color=[colors[i % len(colors)] for i in range(len(labels))],
+    ))
+    fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title='count')
+    return fig
+
+
+def grouped_count_bars(counts, x, hue, title, palette):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    colors = getattr(px.colors.qualitative, palette)
+    table = counts.unstack(hue, fill_value=0)
+    fig = go.Figure([
+        go.Bar(name=str(level), x=table.index.astype(str), y=table[level].to_numpy(),
+               marker_color=colors[i % len(colors)])
+        for i, level in enumerate(table.columns)
+    ])
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title='count', barmode='group', legend_title=hue)
+    return fig
+
+
+def histogram(binned, title, color):
+    import plotly.graph_objects as go
+
+    edges = binned['edges']
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=binned['counts'], width=np.diff(edges),
+        marker_color=color, opacity=0.6, name='count',
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate='%{customdata[0]:.4g} – %{customdata[1]:.4g}<br>count %{y}<extra></extra>',
+    ))
+    if binned['kde_x'] is not None:
+        fig.add_trace(go.Scatter(x=binned['kde_x'], y=binned['kde_y'], mode='lines',
+                                 line_color=color, name='KDE', hoverinfo='skip'))
+    fig.update_layout(title=title, yaxis_title='count', bargap=0, showlegend=False)
+    return fig
+
+
+def mean_sd_bars(moments, xlabel, ylabel, title):
+    import plotly.colors
+    import plotly.graph_objects as go
+
+    n = len(moments)
+    colors = plotly.colors.sample_colorscale('RdBu_r', [0.5] if n == 1 else list(np.linspace(0.1, 0.9, n)))
+    fig = go.Figure(go.Bar(
+        x=moments.index.astype(str), y=moments['mean'].to_numpy(),
+        error_y=dict(type='data', array=moments['std'].to_numpy(), color='#424242', thickness=2.5),
+        marker_color=colors,
+        customdata=moments[['std', 'count']].to_numpy(),
+        hovertemplate='mean %{y:.4g}<br>SD %{customdata[0]:.4g}<br>n %{customdata[1]}<extra></extra>',
+    ))
+    fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title=ylabel)
+    return fig
@@ -0,0 +1,36 @@
+"""Windowed dataset preview for the Data Overview page.
+
+Styling the whole frame makes pandas build HTML/CSS for every cell. The
+preview instead sends one page of rows, and highlights the cells holding a
+column's maximum using maxima computed once per data version.
+"""
+import numpy as np
+import streamlit as st
+
+from utils.schema import numeric_columns
+
+PAGE_SIZES = [25, 50, 100, 250, 500]
+
+
+def column_maxima(df):
+    return df[numeric_columns(df)].max()
+
+
+@st.cache_resource(max_entries=4)
+def cached_column_maxima(_df, version):
+    return column_maxima(_df)
+
+
+def preview_window(df, start, stop, columns):
+    """Rows ``start:stop`` of the chosen columns (a view under copy-on-write)."""
+    return df.iloc[start:stop][columns]
+
+
+def highlight_window(window, maxima, color='yellow'):
+    """Styler for the window that marks each column's dataset-wide maximum."""
+    columns = [col for col in window.columns if col in maxima.index]
+
+    def highlight(col):
+        return np.where(col.to_numpy() == maxima[col.name], f'background-color: {color}', '')
+
+    return window.style.apply(highlight, subset=columns).format(precision=2)
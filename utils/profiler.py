@@ -0,0 +1,385 @@
+"""One-pass, mergeable dataset profile.
+
+The CSV is split into byte ranges on line boundaries and every range is
+profiled in its own process, a chunk of rows at a time, so files larger than
+memory can be summarized. Each column keeps:
+
+* exact count, missing, mean, std (Welford/Chan moments), min and max,
+* approximate quantiles from a KLL-style compactor sketch,
+* an approximate distinct count from a HyperLogLog sketch,
+* the most frequent values from a Misra-Gries summary (reported only while it
+  has never had to drop a value, i.e. while its counts are exact).
+
+All of these merge, so the per-range results combine into the profile of the
+whole file. Both the Data Overview and the Summary Report render from the
+same cached profile.
+"""
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config import PROFILE_CHUNK_BYTES, PROFILE_WORKERS
+from utils.data_loader import clean_columns, load_data
+from utils.schema import apply_schema
+
+# Rows parsed at a time inside a byte range
+_CHUNK_ROWS = 100_000
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch: level i holds items standing for 2**i rows."""
+
+    def __init__(self, k=1024):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._flip = 0
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype='float64')])
+        self._compress()
+
+    def merge(self, other):
+        for i, items in enumerate(other.levels):
+            if i == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[i] = np.concatenate([self.levels[i], items])
+        self._compress()
+
+    def _compress(self):
+        i = 0
+        while i < len(self.levels):
+            items = self.levels[i]
+            if len(items) > self.k:
+                items = np.sort(items)
+                odd = len(items) % 2
+                # Keep every other item (alternating offset) at double weight
+                promoted = items[self._flip:len(items) - odd:2]
+                self._flip ^= 1
+                self.levels[i] = items[len(items) - odd:]
+                if i + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[i + 1] = np.concatenate([self.levels[i + 1], promoted])
+            i += 1
+
+    def quantiles(self, qs):
+        if len(self.levels) == 1:
+            # Nothing compacted yet, the sketch still holds every value
+            return np.quantile(self.levels[0], qs) if len(self.levels[0]) else np.full(len(qs), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** i) for i, level in enumerate(self.levels)])
+        order = np.argsort(items)
+        cumulative = np.cumsum(weights[order])
+        ranks = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side='left')
+        return items[order][np.minimum(ranks, len(items) - 1)]
+
+
+def _bit_length32(values):
+    # frexp is exact for 32-bit integers held in float64
+    return np.where(values > 0, np.frexp(values.astype('float64'))[1], 0)
+
+
+class DistinctSketch:
+    """HyperLogLog distinct-count sketch over 64-bit value hashes."""
+
+    P = 12
+    M = 1 << P
+
+    def __init__(self):
+        self.registers = np.zeros(self.M, dtype=np.uint8)
+
+    def update_hashes(self, hashes):
+        if not len(hashes):
+            return
+        hashes = hashes.astype(np.uint64)
+        idx = (hashes >> np.uint64(64 - self.P)).astype(np.intp)
+        rest = (hashes << np.uint64(self.P)) | np.uint64(1 << (self.P - 1))
+        high = (rest >> np.uint64(32)).astype(np.uint32)
+        low = (rest & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        leading_zeros = np.where(high > 0, 32 - _bit_length32(high), 64 - _bit_length32(low))
+        np.maximum.at(self.registers, idx, (leading_zeros + 1).astype(np.uint8))
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.M)
+        raw = alpha * self.M ** 2 / np.sum(2.0 ** -self.registers.astype('float64'))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.M and zeros:
+            return int(round(self.M * np.log(self.M / zeros)))
+        return int(round(raw))
+
+
+class TopValues:
+    """Misra-Gries frequent-value summary (exact while distinct values fit)."""
+
+    def __init__(self, capacity=32):
+        self.capacity = capacity
+        self.counts = {}
+        # False once values were dropped; the counts are then only lower bounds
+        self.exact = True
+
+    def update_counts(self, counts):
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        if len(self.counts) > self.capacity:
+            ordered = sorted(self.counts.values(), reverse=True)
+            floor = ordered[self.capacity]
+            self.counts = {v: c - floor for v, c in self.counts.items() if c > floor}
+            self.exact = False
+
+    def merge(self, other):
+        self.update_counts(other.counts)
+        self.exact = self.exact and other.exact
+
+    def most_common(self, n=None):
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:n]
+
+
+class ColumnProfile:
+    """Mergeable summary of one column."""
+
+    def __init__(self, dtype):
+        self.dtype = str(dtype)
+        self.numeric = pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.quantiles = QuantileSketch()
+        self.distinct = DistinctSketch()
+        self.top = TopValues()
+
+    def update(self, series):
+        present = series.dropna()
+        self.missing += len(series) - len(present)
+        if isinstance(present.dtype, pd.CategoricalDtype):
+            codes = present.cat.codes.to_numpy()
+            category_hashes = pd.util.hash_array(present.cat.categories.to_numpy(dtype=object))
+            self.distinct.update_hashes(category_hashes[codes])
+        elif self.numeric:
+            self.distinct.update_hashes(pd.util.hash_array(present.to_numpy(dtype='float64')))
+        else:
+            self.distinct.update_hashes(pd.util.hash_array(present.astype(str).to_numpy(dtype=object)))
+        counts = present.value_counts(sort=False)
+        plain = _float32_value if self.dtype == 'float32' else _plain
+        self.top.update_counts({plain(value): count for value, count in counts.items() if count})
+
+        if self.numeric and len(present):
+            values = present.to_numpy(dtype='float64')
+            other = ColumnProfile(self.dtype)
+            other.count = len(values)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min, other.max = float(values.min()), float(values.max())
+            self._merge_moments(other)
+            self.quantiles.update(values)
+        else:
+            self.count += len(present)
+
+    def _merge_moments(self, other):
+        total = self.count + other.count
+        if other.count == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min = np.nanmin([self.min, other.min])
+        self.max = np.nanmax([self.max, other.max])
+
+    def merge(self, other):
+        if self.dtype != other.dtype:
+            self.dtype = _common_dtype(self.dtype, other.dtype)
+        self.missing += other.missing
+        if self.numeric:
+            self._merge_moments(other)
+            self.quantiles.merge(other.quantiles)
+        else:
+            self.count += other.count
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+
+def _plain(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _float32_value(value):
+    # Shortest decimal that round-trips at float32 precision: 7.6, not 7.599999904632568
+    return float(str(np.float32(value)))
+
+
+def _common_dtype(a, b):
+    try:
+        return str(np.result_type(a, b))
+    except TypeError:
+        return 'object'
+
+
+class DatasetProfile:
+    """Column profiles of a whole dataset, mergeable across chunks."""
+
+    def __init__(self):
+        self.n_rows = 0
+        self.columns = {}
+
+    def update(self, chunk):
+        self.n_rows += len(chunk)
+        for col in chunk.columns:
+            if col not in self.columns:
+                self.columns[col] = ColumnProfile(chunk[col].dtype)
+            self.columns[col].update(chunk[col])
+        return self
+
+    def merge(self, other):
+        self.n_rows += other.n_rows
+        for col, column in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(column)
+            else:
+                self.columns[col] = column
+        return self
+
+    def column_info(self):
+        """Name, storage type and missing count per column."""
+        return pd.DataFrame({
+            "Column Name": list(self.columns),
+            "Data Type": [column.dtype for column in self.columns.values()],
+            "Missing Values": [column.missing for column in self.columns.values()],
+        })
+
+    def missing(self):
+        return pd.Series({col: column.missing for col, column in self.columns.items()})
+
+    def value_counts(self, col):
+        values, counts = zip(*self.columns[col].top.most_common()) if self.columns[col].top.counts else ((), ())
+        return pd.Series(counts, index=pd.Index(values, name=col), name='count')
+
+    def describe(self):
+        """Table shaped like ``DataFrame.describe(include='all').transpose()``.
+
+        ``top``/``freq`` are left empty for columns whose frequent-value summary
+        is not exact.
+        """
+        rows = {}
+        for col, column in self.columns.items():
+            top = column.top.most_common(1) if column.top.exact else []
+            row = {
+                'count': column.count,
+                'unique': column.distinct.estimate(),
+                'top': top[0][0] if top else np.nan,
+                'freq': top[0][1] if top else np.nan,
+            }
+            if column.numeric and column.count:
+                q25, q50, q75 = column.quantiles.quantiles([0.25, 0.5, 0.75])
+                row.update({'mean': column.mean, 'std': column.std, 'min': column.min,
+                            '25%': q25, '50%': q50, '75%': q75, 'max': column.max})
+                if column.dtype == 'float32':
+                    # Data values stored as float32, shown at that precision
+                    for key in ('min', '25%', '50%', '75%', 'max'):
+                        row[key] = _float32_value(row[key])
+            rows[col] = row
+        columns = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+        table = pd.DataFrame.from_dict(rows, orient='index').reindex(columns=columns)
+        # Mixed value types in "top" would trip Arrow when Streamlit serializes the table
+        table['top'] = table['top'].astype(str).where(table['top'].notna())
+        return table
+
+
+def _read_header(path, sep):
+    with open(path, 'rb') as f:
+        header = f.readline()
+        body_start = f.tell()
+    names = pd.read_csv(io.BytesIO(header), sep=sep, skipinitialspace=True, nrows=0).columns
+    return clean_columns(pd.DataFrame(columns=names)).columns.tolist(), body_start
+
+
+def _split_ranges(path, start, chunk_bytes):
+    # Byte ranges that end on line boundaries
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _profile_range(path, start, end, names, sep):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    profile = DatasetProfile()
+    reader = pd.read_csv(io.BytesIO(data), sep=sep, skipinitialspace=True, header=None,
+                         names=names, chunksize=_CHUNK_ROWS)
+    for chunk in reader:
+        profile.update(apply_schema(chunk))
+    return profile
+
+
+def profile_csv(path, sep=';', workers=PROFILE_WORKERS, chunk_bytes=PROFILE_CHUNK_BYTES):
+    """Profile a CSV file in one pass, spreading byte ranges over a process pool.
+
+    Rows are assumed not to contain quoted line breaks.
+    """
+    path = os.path.abspath(path)
+    names, body_start = _read_header(path, sep)
+    ranges = _split_ranges(path, body_start, chunk_bytes)
+    profile = DatasetProfile()
+    if len(ranges) <= 1:
+        for start, end in ranges:
+            profile.merge(_profile_range(path, start, end, names, sep))
+        return profile
+
+    workers = min(workers or os.cpu_count() or 1, len(ranges))
+    # spawn, not fork: the Streamlit server process is multi-threaded
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(_profile_range, path, start, end, names, sep) for start, end in ranges]
+        for future in futures:
+            profile.merge(future.result())
+    return profile
+
+
+def profile_frame(df, chunk_rows=_CHUNK_ROWS):
+    """Profile an already loaded frame (e.g. an upload) chunk by chunk."""
+    profile = DatasetProfile()
+    for start in range(0, len(df), chunk_rows):
+        profile.update(df.iloc[start:start + chunk_rows])
+    return profile
+
+
+@st.cache_resource(show_spinner="Profiling dataset...", max_entries=4)
+def dataset_profile(path, version):
+    """Profile of the dataset file, computed once per data version."""
+    return profile_csv(path)
+
+
+@st.cache_resource(show_spinner="Profiling dataset...", max_entries=4)
+def _frame_profile(_df, version):
+    return profile_frame(_df)
+
+
+def profile_dataset(dataset):
+    """Cached profile of a registered dataset.
+
+    CSV files are streamed from disk without loading them; uploads and XLSX
+    files are profiled from their (cached) frame.
+    """
+    if dataset.path is not None and dataset.format == 'csv':
+        return dataset_profile(dataset.path, dataset.version)
+    return _frame_profile(load_data(dataset), dataset.version)
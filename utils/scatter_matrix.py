@@ -0,0 +1,127 @@
+"""Full-population scatter matrix built from 2D bin counts.
+
+Instead of drawing one marker per (sampled) row, every column is cut into at
+most ``max_bins`` bins and each pair of columns becomes a per-class 2D
+histogram computed with a single ``np.bincount``. Binning is linear in the
+number of rows; drawing only depends on the bin grid, so the whole cohort can
+be shown.
+"""
+import textwrap
+
+import numpy as np
+
+
+def _edges(values, max_bins, integer):
+    lo, hi = (float(values.min()), float(values.max())) if len(values) else (0.0, 1.0)
+    if integer and hi - lo + 1 <= max_bins:
+        # One bin per integer code, avoids empty stripes between codes
+        return np.arange(lo - 0.5, hi + 1.5)
+    if hi == lo:
+        hi = lo + 1.0
+    return np.linspace(lo, hi, max_bins + 1)
+
+
+def _bin_index(values, edges):
+    width = edges[1] - edges[0]
+    return np.clip(((values - edges[0]) / width).astype(np.int64), 0, len(edges) - 2)
+
+
+class BinnedScatterMatrix:
+    """Per-class 1D and 2D bin counts for a list of columns."""
+
+    def __init__(self, columns, class_labels, edges, diagonal, pairs):
+        self.columns = columns
+        self.class_labels = class_labels
+        self.edges = edges        # bin edges per column
+        self.diagonal = diagonal  # per column: (classes, bins) counts
+        self.pairs = pairs        # {(i, j): (classes, bins_i, bins_j) counts}
+
+    @classmethod
+    def from_frame(cls, df, columns, class_column, positions=None, max_bins=40):
+        classes = df[class_column].cat.codes.to_numpy()
+        arrays = [df[col].to_numpy(dtype='float64', na_value=np.nan) for col in columns]
+        if positions is not None:
+            classes = classes[positions]
+            arrays = [values[positions] for values in arrays]
+
+        complete = classes >= 0
+        for values in arrays:
+            complete &= ~np.isnan(values)
+        classes = classes[complete].astype(np.int64)
+        arrays = [values[complete] for values in arrays]
+
+        class_labels = [str(label) for label in df[class_column].cat.categories]
+        n_classes = len(class_labels)
+        integer = [df[col].dtype.kind in 'iu' for col in columns]
+        edges = [_edges(values, max_bins, is_int) for values, is_int in zip(arrays, integer)]
+        bins = [_bin_index(values, col_edges) for values, col_edges in zip(arrays, edges)]
+        sizes = [len(col_edges) - 1 for col_edges in edges]
+
+        diagonal = [
+            np.bincount(classes * size + idx, minlength=n_classes * size).reshape(n_classes, size)
+            for idx, size in zip(bins, sizes)
+        ]
+        pairs = {}
+        for i in range(len(columns)):
+            for j in range(i + 1, len(columns)):
+                flat = (classes * sizes[i] + bins[i]) * sizes[j] + bins[j]
+                counts = np.bincount(flat, minlength=n_classes * sizes[i] * sizes[j])
+                pairs[(i, j)] = counts.reshape(n_classes, sizes[i], sizes[j])
+        return cls(list(columns), class_labels, edges, diagonal, pairs)
+
+    def _density_image(self, counts, colors):
+        # Colour each cell by its class mix, opacity by log density
+        total = counts.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            share = np.where(total > 0, counts / total, 0)
+        rgb = np.tensordot(share, colors, axes=([0], [0]))
+        alpha = np.log1p(total) / max(np.log1p(total.max()), 1e-12)
+        return np.dstack([rgb, alpha])
+
+    def figure(self, palette, height=2.5):
+        # Plotting imports are deferred until a figure is actually drawn
+        from matplotlib.colors import to_rgb
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Patch
+
+        k = len(self.columns)
+        colors = np.array([to_rgb(color) for color in palette[:len(self.class_labels)]])
+        fig = Figure(figsize=(height * k, height * k))
+        axes = fig.subplots(k, k, squeeze=False)
+        for i in range(k):
+            for j in range(k):
+                ax = axes[i, j]
+                if i == j:
+                    for counts, color in zip(self.diagonal[i], colors):
+                        ax.stairs(counts, self.edges[i], color=color, linewidth=1.5)
+                else:
+                    # Row i is the y axis, column j the x axis, like seaborn's pairplot
+                    a, b = min(i, j), max(i, j)
+                    counts = self.pairs[(a, b)]
+                    if i > j:
+                        counts = counts.transpose(0, 2, 1)
+                    ax.imshow(
+                        self._density_image(counts, colors),
+                        origin='lower', aspect='auto', interpolation='nearest',
+                        extent=(self.edges[j][0], self.edges[j][-1], self.edges[i][0], self.edges[i][-1])
+                    )
+                if i == k - 1:
+                    ax.set_xlabel(textwrap.fill(self.columns[j], 22), fontsize='small')
+                else:
+                    ax.set_xticklabels([])
+                if j == 0 and i != j:
+                    ax.set_ylabel(textwrap.fill(self.columns[i], 22), fontsize='small')
+        fig.legend(
+            handles=[Patch(color=color, label=label) for label, color in zip(self.class_labels, colors)],
+            loc='center right', title='Target'
+        )
+        fig.tight_layout(rect=(0, 0, 0.9, 1))
+        return fig
+
+
+def binned_scatter_matrix(df, columns, class_column, palette, positions=None, max_bins=40):
+    """Figure of the full-population scatter matrix (histogram diagonals)."""
+    import seaborn as sns
+
+    matrix = BinnedScatterMatrix.from_frame(df, columns, class_column, positions, max_bins)
+    return matrix.figure(sns.color_palette(palette) if isinstance(palette, str) else palette)
@@ -0,0 +1,118 @@
+"""Declared column types for the student dataset.
+
+Nearly every column is a small integer code, so loading everything as
+int64/float64/object wastes most of the memory a session holds. The 0/1
+flags are stored as int8 rather than bool: same footprint, but they stay
+numeric so the correlation and EDA pages keep treating them as features.
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from utils.variables import variable_dict
+
+# Storage type for each metadata "Type" in the variable dictionary
+_METADATA_DTYPES = {"Continuous": "float32", "Integer": "int16"}
+
+# Columns missing from the variable dictionary, or that fit a smaller type
+_DECLARED_DTYPES = {
+    "Marital status": "int8",
+    "Application mode": "int8",
+    "Application order": "int8",
+    "Course": "int16",
+    "Daytime/evening attendance": "int8",
+    "Previous qualification": "int8",
+    "Previous qualification (grade)": "float32",
+    "Nacionality": "int8",
+    "Mother's qualification": "int8",
+    "Father's qualification": "int8",
+    "Displaced": "int8",
+    "Educational special needs": "int8",
+    "Debtor": "int8",
+    "Tuition fees up to date": "int8",
+    "Gender": "int8",
+    "Scholarship holder": "int8",
+    "Age at enrollment": "int8",
+    "International": "int8",
+    "Curricular units 1st sem (credited)": "int8",
+    "Curricular units 1st sem (enrolled)": "int8",
+    "Curricular units 1st sem (evaluations)": "int8",
+    "Curricular units 1st sem (approved)": "int8",
+    "Curricular units 1st sem (without evaluations)": "int8",
+    "Curricular units 2nd sem (credited)": "int8",
+    "Curricular units 2nd sem (enrolled)": "int8",
+    "Curricular units 2nd sem (evaluations)": "int8",
+    "Curricular units 2nd sem (approved)": "int8",
+    "Curricular units 2nd sem (grade)": "float32",
+    "Curricular units 2nd sem (without evaluations)": "int8",
+    "Unemployment rate": "float32",
+    "Inflation rate": "float32",
+    "GDP": "float32",
+    "Target": "category",
+}
+
+STUDENT_SCHEMA = {
+    **{col: _METADATA_DTYPES[meta["Type"]] for col, meta in variable_dict.items()},
+    **_DECLARED_DTYPES,
+}
+
+
+def _fits(series, dtype):
+    # Integer casts are only safe for complete columns inside the type's range
+    if not pd.api.types.is_numeric_dtype(series) or series.isna().any():
+        return False
+    values = series.to_numpy()
+    if values.dtype.kind == 'f' and not np.array_equal(values, np.round(values)):
+        return False
+    info = np.iinfo(dtype)
+    return len(values) == 0 or (values.min() >= info.min and values.max() <= info.max)
+
+
+def apply_schema(df, schema=STUDENT_SCHEMA):
+    """Cast the columns of a freshly parsed frame to the declared types (in place).
+
+    Columns that do not fit their declared integer type (missing values, codes
+    out of range) are left as parsed, so unexpected uploads still load.
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        if dtype.startswith("int"):
+            if _fits(df[col], dtype):
+                df[col] = df[col].astype(dtype)
+        elif dtype.startswith("float"):
+            if pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def numeric_columns(df):
+    """Names of the numeric (int/float) columns, whatever their width."""
+    return df.select_dtypes(include='number').columns.tolist()
+
+
+def memory_usage_bytes(df):
+    """Bytes held by the frame's columns and index."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def default_dtype_memory_bytes(df):
+    """Estimate of the same frame's size had pandas kept its default dtypes.
+
+    Numbers take 8 bytes per row; categorical columns would have been Python
+    strings, costing a pointer plus the string object per row.
+    """
+    total = int(df.index.memory_usage(deep=True))
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            counts = series.value_counts(sort=False)
+            total += 8 * len(series) + sum(sys.getsizeof(value) * n for value, n in counts.items())
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            total += 8 * len(series)
+        else:
+            total += int(series.memory_usage(deep=True, index=False))
+    return total
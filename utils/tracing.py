@@ -0,0 +1,135 @@
+"""Named timing spans around the hot paths of every page.
+
+Pages call ``start_page_trace`` at the top, wrap their load / transform /
+aggregate / render phases in ``span(...)`` and call ``end_page_trace`` at the
+bottom. When tracing is off (the default) ``span`` hands back one shared
+no-op context manager, so the instrumentation costs a function call.
+
+When it is on (``TRACE_ENABLED`` in config.py or ``STUDENT_APP_TRACE=1``),
+each page run collects span durations and process RSS deltas, shows them in a
+sidebar panel, appends them as one JSON line to ``TRACE_LOG_PATH`` and
+rewrites a Prometheus textfile-collector file at ``TRACE_PROM_PATH``.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+
+from config import TRACE_ENABLED, TRACE_LOG_PATH, TRACE_PROM_PATH
+
+ENABLED = TRACE_ENABLED or os.environ.get("STUDENT_APP_TRACE") == "1"
+
+_NOOP = contextlib.nullcontext()
+_local = threading.local()
+# Process-wide totals per (page, span) for the Prometheus file
+_totals = {}
+_totals_lock = threading.Lock()
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Span:
+    __slots__ = ("trace", "record", "start", "rss")
+
+    def __init__(self, name, trace):
+        self.trace = trace
+        # Appended on entry so the list stays in start order, parents before children
+        self.record = {"span": name, "depth": trace["depth"], "ms": None, "rss_delta_mb": None}
+
+    def __enter__(self):
+        self.trace["spans"].append(self.record)
+        self.trace["depth"] += 1
+        self.rss = _rss_bytes()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        rss = _rss_bytes()
+        self.trace["depth"] -= 1
+        self.record["ms"] = round(elapsed * 1000, 2)
+        if rss is not None and self.rss is not None:
+            self.record["rss_delta_mb"] = round((rss - self.rss) / 1e6, 2)
+
+
+def span(name):
+    """Context manager timing ``name`` inside the current page run."""
+    if not ENABLED:
+        return _NOOP
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NOOP  # e.g. a background thread, not part of a page run
+    return _Span(name, trace)
+
+
+def start_page_trace(page):
+    """Begin collecting spans for this run of ``page`` (no-op when disabled)."""
+    if ENABLED:
+        _local.trace = {"page": page, "start": time.time(), "depth": 0, "spans": []}
+
+
+def end_page_trace():
+    """Show the sidebar panel and write the collected spans out."""
+    if not ENABLED:
+        return
+    trace = getattr(_local, "trace", None)
+    _local.trace = None
+    if trace is None:
+        return
+    # Drop spans left open by an exception so every record has a duration
+    trace["spans"] = [s for s in trace["spans"] if s["ms"] is not None]
+    _show_panel(trace["page"], trace["spans"])
+    if TRACE_LOG_PATH:
+        _append_json_line(trace)
+    if TRACE_PROM_PATH:
+        _update_prometheus(trace)
+
+
+def _show_panel(page, spans):
+    with st.sidebar.expander("Performance", expanded=False):
+        if not spans:
+            st.caption("No spans recorded on this run.")
+            return
+        st.dataframe(
+            [{"Span": "· " * s["depth"] + s["span"], "ms": s["ms"], "RSS Δ (MB)": s["rss_delta_mb"]} for s in spans],
+            hide_index=True,
+        )
+        st.caption(f"{page}: {sum(s['ms'] for s in spans if s['depth'] == 0):.1f} ms in top-level spans")
+
+
+def _append_json_line(trace):
+    os.makedirs(os.path.dirname(TRACE_LOG_PATH) or ".", exist_ok=True)
+    record = {"ts": round(trace["start"], 3), "page": trace["page"], "spans": trace["spans"]}
+    with open(TRACE_LOG_PATH, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _update_prometheus(trace):
+    with _totals_lock:
+        for s in trace["spans"]:
+            key = (trace["page"], s["span"])
+            count, seconds = _totals.get(key, (0, 0.0))
+            _totals[key] = (count + 1, seconds + s["ms"] / 1000)
+        lines = [
+            "# HELP student_app_span_seconds Time spent in traced app spans.",
+            "# TYPE student_app_span_seconds summary",
+        ]
+        for (page, name), (count, seconds) in sorted(_totals.items()):
+            labels = f'page="{page}",span="{name}"'
+            lines.append(f"student_app_span_seconds_sum{{{labels}}} {seconds:.6f}")
+            lines.append(f"student_app_span_seconds_count{{{labels}}} {count}")
+        os.makedirs(os.path.dirname(TRACE_PROM_PATH) or ".", exist_ok=True)
+        tmp = f"{TRACE_PROM_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, TRACE_PROM_PATH)
@@ -0,0 +1,151 @@
+"""Background warm-up of the shared caches.
+
+The first script run of any page starts one daemon thread per server process
+(held in ``st.cache_resource``) that fills the same caches the pages read for
+the default dataset: the cleaned frame, correlation statistics, the column
+profile, association measures, the aggregate cube and bitmap index, and the
+charts each page draws with its default widget values. Pages that arrive
+while a step is running wait on that cache entry instead of computing it
+twice, and everything after it is served from memory. The charts come from
+the same utils/chart_specs.py functions the pages call.
+"""
+import logging
+import threading
+
+import streamlit as st
+
+from config import WARMUP_ENABLED
+from utils import chart_specs
+from utils.association import feature_associations
+from utils.bitmap_index import bitmap_index
+from utils.correlation import correlation_stats
+from utils.cube import aggregate_cube
+from utils.data_loader import default_dataset, load_data
+from utils.figure_cache import prerender_chart
+from utils.profiler import profile_dataset
+from utils.schema import numeric_columns
+
+_THREAD_NAME = "cache-warmup"
+
+
+class Warmup:
+    """Progress of the warm-up thread, read by the pages."""
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.completed = 0
+        self.current = None
+        self.errors = {}
+        self.finished = False
+        self._context = {}
+
+    @property
+    def fraction(self):
+        return self.completed / len(self.steps)
+
+    def run(self):
+        for name, step in self.steps:
+            self.current = name
+            try:
+                step(self._context)
+            except Exception as exc:  # the pages compute it themselves and report the error
+                self.errors[name] = repr(exc)
+                if 'df' not in self._context:
+                    break  # nothing else can be warmed without the data
+            self.completed += 1
+        self.current = None
+        self.finished = True
+        self._context.clear()
+
+
+def _load(ctx):
+    ctx['dataset'] = default_dataset()
+    ctx['version'] = ctx['dataset'].version
+    ctx['df'] = load_data(ctx['dataset'])
+
+
+def _correlations(ctx):
+    ctx['stats'] = correlation_stats(ctx['df'], ctx['version'])
+
+
+def _profile(ctx):
+    profile_dataset(ctx['dataset'])
+
+
+def _associations(ctx):
+    ctx['associations'] = feature_associations(ctx['df'], ctx['version'])
+
+
+def _indexes(ctx):
+    ctx['cube'] = aggregate_cube(ctx['df'], ctx['version'])
+    ctx['index'] = bitmap_index(ctx['df'], ctx['version'])
+
+
+def _feature_analysis_figure(ctx):
+    features = numeric_columns(ctx['df'])
+    measure = chart_specs.FEATURE_ANALYSIS_MEASURE
+    corr = chart_specs.target_associations(ctx['stats'], ctx.get('associations'), measure, features)
+    top_n = min(chart_specs.FEATURE_ANALYSIS_TOP_N, len(corr))
+    prerender_chart(ctx['version'], chart_specs.top_associations_chart(corr, measure, features, True, True, top_n))
+
+
+def _correlation_study_figure(ctx):
+    features = chart_specs.study_features(ctx['df'])
+    corr_matrix, top_features = chart_specs.top_correlated(ctx['stats'], features)
+    prerender_chart(ctx['version'], chart_specs.heatmap_chart(
+        corr_matrix, top_features, features, True, chart_specs.HEATMAP_TOP_N
+    ))
+
+
+def _eda_figures(ctx):
+    df, version, cube, index = ctx['df'], ctx['version'], ctx['cube'], ctx['index']
+    filters = chart_specs.all_levels(cube)
+    cube = cube.slice(filters)
+    selection = index.select(filters)
+    # The page defaults to the interactive backend for these
+    prerender_chart(version, chart_specs.target_distribution_chart(cube, filters, True))
+    prerender_chart(version, chart_specs.gender_vs_target_chart(cube, filters, True))
+    prerender_chart(version, chart_specs.age_histogram_chart(df, selection, filters, True))
+    top_corr_cols = chart_specs.top_target_features(cube, chart_specs.study_features(df))
+    for col in top_corr_cols:
+        prerender_chart(version, chart_specs.mean_sd_chart(cube, col, filters, True))
+    prerender_chart(version, chart_specs.scatter_matrix_chart(df, top_corr_cols, selection, filters))
+
+
+STEPS = [
+    ("Loading dataset", _load),
+    ("Correlation statistics", _correlations),
+    ("Column profile", _profile),
+    ("Feature associations", _associations),
+    ("Aggregate cube and bitmap index", _indexes),
+    ("Feature Analysis chart", _feature_analysis_figure),
+    ("Correlation heatmap", _correlation_study_figure),
+    ("EDA charts", _eda_figures),
+]
+
+
+class _SkipWarmupThread(logging.Filter):
+    # Cached functions look for a page's script context, which this thread never has
+    def filter(self, record):
+        return record.threadName != _THREAD_NAME
+
+
+@st.cache_resource(show_spinner=False)
+def _warmup():
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_SkipWarmupThread())
+    warmup = Warmup(STEPS)
+    threading.Thread(target=warmup.run, name=_THREAD_NAME, daemon=True).start()
+    return warmup
+
+
+def start_warmup():
+    """Start the warm-up once per process and show its progress in the sidebar until done."""
+    if not WARMUP_ENABLED:
+        return None
+    warmup = _warmup()
+    if not warmup.finished:
+        st.sidebar.progress(
+            warmup.fraction,
+            text=f"Warming up caches ({warmup.completed}/{len(warmup.steps)}): {warmup.current or 'starting'}",
+        )
+    return warmup